@@ -6,17 +6,74 @@ Uses Confluence REST API v2 for pages, v1 for search and spaces.
 
 import argparse
 import base64
+import functools
 import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Shared client so the TLS connection stays alive between calls
+# (create/update flows do two round-trips each). With httpx[http2]
+# installed, bulk operations multiplex over a single HTTP/2 connection.
+_CLIENT = None
+
+
+def _build_client():
+    """Build the shared HTTP client: httpx with HTTP/2 when available,
+    otherwise a pooled requests.Session."""
+    if httpx is not None:
+        try:
+            return httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=30.0,
+                headers=get_auth_header(),
+            )
+        except ImportError:
+            pass  # httpx installed without the http2 extra
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "POST", "PUT", "DELETE"],
+        ),
+    ))
+    session.headers.update(get_auth_header())
+    return session
+
+
+def get_session():
+    """Get the shared HTTP client, constructed on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = _build_client()
+    return _CLIENT
+
+
+@functools.cache
 def get_auth_header() -> dict:
-    """Create authorization header for API requests."""
+    """Create authorization header for API requests (computed once per process)."""
     email = os.environ.get('CONFLUENCE_EMAIL')
     token = os.environ.get('CONFLUENCE_API_TOKEN')
 
@@ -27,44 +84,89 @@ def get_auth_header() -> dict:
     return {"Authorization": f"Basic {credentials}", "Content-Type": "application/json"}
 
 
+@functools.cache
 def get_base_url() -> str:
-    """Get the base URL for API requests."""
+    """Get the base URL for API requests (computed once per process)."""
     cloud_id = os.environ.get('CONFLUENCE_CLOUD_ID')
     if not cloud_id:
         raise ValueError("CONFLUENCE_CLOUD_ID is required")
     return f"https://api.atlassian.com/ex/confluence/{cloud_id}/wiki/api/v2"
 
 
-def format_response(data) -> str:
-    """Format response as JSON."""
-    return json.dumps(data, ensure_ascii=False, indent=2)
+def format_response(data) -> bytes:
+    """Format response as indented JSON bytes, ready for the stdout buffer."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def format_error(message: str) -> bytes:
+    """Format error as JSON bytes."""
+    return format_response({"error": message})
+
+
+def emit(payload: bytes) -> None:
+    """Write a formatted payload straight to stdout's byte buffer, skipping
+    print's str re-encode — the dominant CPU cost for large page bodies."""
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
 
 
-def format_error(message: str) -> str:
-    """Format error as JSON."""
-    return json.dumps({"error": message}, ensure_ascii=False, indent=2)
+def parse_json(raw: bytes):
+    """Parse JSON from raw response bytes without an intermediate str copy."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
-def handle_response(response: requests.Response) -> dict:
+def handle_response(response) -> dict:
     """Handle API response and raise errors if needed."""
     if response.status_code >= 400:
         try:
-            error_data = response.json()
+            error_data = parse_json(response.content)
             message = error_data.get("message", response.text)
         except Exception:
             message = response.text
         raise Exception(f"{response.status_code}: {message}")
-    return response.json() if response.text else {}
+    # 204 (e.g. DELETE) and empty bodies: nothing to decode
+    if response.status_code == 204 or not response.content:
+        return {}
+    # Parse from response.content: avoids the full utf-8 str that
+    # response.json() materializes, which matters for 100KB+ page bodies
+    return parse_json(response.content)
+
+
+# Space keys map to stable IDs, so resolve each key at most once per process.
+_SPACE_ID_CACHE: dict = {}
+
+
+def _resolve_space_id(space_key: str) -> str:
+    """Resolve a space key to its ID, cached for the process lifetime."""
+    if space_key not in _SPACE_ID_CACHE:
+        _resolve_space_ids((space_key,))
+    if space_key not in _SPACE_ID_CACHE:
+        raise Exception(f"Space '{space_key}' not found")
+    return _SPACE_ID_CACHE[space_key]
+
+
+def _resolve_space_ids(space_keys: tuple) -> dict:
+    """Resolve multiple space keys to IDs in a single request, priming the cache."""
+    keys_param = '&keys='.join(quote(key) for key in space_keys)
+    response = get_session().get(f"{get_base_url()}/spaces?keys={keys_param}")
+    space_data = handle_response(response)
+    for space in space_data.get("results", []):
+        _SPACE_ID_CACHE[space.get("key")] = space.get("id")
+    return {key: _SPACE_ID_CACHE[key] for key in space_keys if key in _SPACE_ID_CACHE}
 
 
 # Commands
 
-def test_connection() -> str:
+def test_connection() -> bytes:
     """Test connection by fetching pages list."""
     try:
         base_url = get_base_url()
-        headers = get_auth_header()
-        response = requests.get(f"{base_url}/pages?limit=1", headers=headers)
+        session = get_session()
+        response = session.get(f"{base_url}/pages?limit=1")
         handle_response(response)
         cloud_id = os.environ.get('CONFLUENCE_CLOUD_ID', 'not set')
         return format_response({
@@ -76,6 +178,11 @@ def test_connection() -> str:
         return format_error(str(e))
 
 
+def _cql_escape(value: str) -> str:
+    """Escape backslashes and quotes for safe interpolation into CQL."""
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
 def search_pages(
     query: str,
     space: Optional[str] = None,
@@ -84,91 +191,164 @@ def search_pages(
     created_after: Optional[str] = None,
     modified_after: Optional[str] = None,
     sort: Optional[str] = None,
-    limit: int = 25
-) -> str:
+    limit: int = 25,
+    include_body: bool = False
+) -> bytes:
     """Search for pages using CQL (Confluence Query Language)."""
+    # Errors are formatted here, outside the cache, so a transient failure
+    # is never memoized and replayed for identical later searches
     try:
-        cloud_id = os.environ.get('CONFLUENCE_CLOUD_ID')
-        if not cloud_id:
-            raise ValueError("CONFLUENCE_CLOUD_ID is required")
+        return _search_pages_cached(
+            query, space, tuple(labels) if labels else None, creator,
+            created_after, modified_after, sort, limit, include_body
+        )
+    except Exception as e:
+        return format_error(str(e))
 
-        # Use v1 search API with CQL (works with search:confluence scope)
-        search_url = f"https://api.atlassian.com/ex/confluence/{cloud_id}/wiki/rest/api/search"
-        headers = get_auth_header()
-
-        # Build CQL query - search in both title and content
-        cql = f'(title~"{query}" OR text~"{query}") AND type=page'
-        if space:
-            cql += f' AND space="{space}"'
-        if labels:
-            label_clause = ' AND '.join(f'label="{lbl}"' for lbl in labels)
-            cql += f' AND ({label_clause})'
-        if creator:
-            cql += f' AND creator="{creator}"'
-        if created_after:
-            cql += f' AND created>="{created_after}"'
-        if modified_after:
-            cql += f' AND lastmodified>="{modified_after}"'
-        if sort:
-            cql += f' order by {sort}'
-
-        params = {"cql": cql, "limit": limit}
-        response = requests.get(search_url, headers=headers, params=params)
-        data = handle_response(response)
 
-        pages = []
-        for result in data.get("results", []):
-            content = result.get("content", {})
-            if content.get("type") == "page":
-                page_info = {
-                    "id": content.get("id"),
-                    "title": content.get("title"),
-                    "status": content.get("status"),
-                    "space": result.get("resultGlobalContainer", {}).get("title"),
-                    "_links": {
-                        "webui": content.get("_links", {}).get("webui"),
-                    }
+@functools.lru_cache(maxsize=256)
+def _search_pages_cached(
+    query: str,
+    space: Optional[str],
+    labels: Optional[tuple],
+    creator: Optional[str],
+    created_after: Optional[str],
+    modified_after: Optional[str],
+    sort: Optional[str],
+    limit: int,
+    include_body: bool
+) -> bytes:
+    """Run the search; identical queries within a process hit the cache.
+
+    Exceptions propagate to the caller so only successful responses are
+    cached; the search_pages wrapper turns them into error payloads.
+    """
+    cloud_id = os.environ.get('CONFLUENCE_CLOUD_ID')
+    if not cloud_id:
+        raise ValueError("CONFLUENCE_CLOUD_ID is required")
+
+    # Use v1 content search with expand so version/space/ancestors (and
+    # optionally the body) come back in one call instead of N+1 fetches
+    search_url = f"https://api.atlassian.com/ex/confluence/{cloud_id}/wiki/rest/api/content/search"
+    session = get_session()
+
+    # Build CQL query - search in both title and content
+    q = _cql_escape(query)
+    cql = f'(title~"{q}" OR text~"{q}") AND type=page'
+    if space:
+        cql += f' AND space="{_cql_escape(space)}"'
+    if labels:
+        label_clause = ' AND '.join(f'label="{_cql_escape(lbl)}"' for lbl in labels)
+        cql += f' AND ({label_clause})'
+    if creator:
+        cql += f' AND creator="{_cql_escape(creator)}"'
+    if created_after:
+        cql += f' AND created>="{_cql_escape(created_after)}"'
+    if modified_after:
+        cql += f' AND lastmodified>="{_cql_escape(modified_after)}"'
+    if sort:
+        cql += f' order by {sort}'
+
+    expand = "version,space,ancestors,childTypes.page,metadata.labels"
+    if include_body:
+        expand += ",body.storage"
+    params = {"cql": cql, "limit": limit, "expand": expand}
+    response = session.get(search_url, params=params)
+    data = handle_response(response)
+
+    pages = []
+    for result in data.get("results", []):
+        if result.get("type") == "page":
+            ancestors = result.get("ancestors") or []
+            version = result.get("version") or {}
+            page_info = {
+                "id": result.get("id"),
+                "title": result.get("title"),
+                "status": result.get("status"),
+                "space": (result.get("space") or {}).get("key"),
+                "version": version.get("number"),
+                "parentId": ancestors[-1].get("id") if ancestors else None,
+                "_links": {
+                    "webui": (result.get("_links") or {}).get("webui"),
                 }
-                # Add excerpt if available
-                if result.get("excerpt"):
-                    page_info["excerpt"] = result.get("excerpt")
-                # Add last modified date if available
-                if result.get("lastModified"):
-                    page_info["lastModified"] = result.get("lastModified")
-                # Add labels from content metadata
-                metadata = content.get("metadata", {})
-                labels_data = metadata.get("labels", {})
-                if labels_data.get("results"):
-                    page_info["labels"] = [lbl.get("name") for lbl in labels_data.get("results", [])]
-                pages.append(page_info)
-        return format_response({"total": len(pages), "pages": pages})
-    except Exception as e:
-        return format_error(str(e))
+            }
+            if include_body:
+                page_info["body"] = ((result.get("body") or {}).get("storage") or {}).get("value")
+            # Add last modified date from the expanded version
+            if version.get("when"):
+                page_info["lastModified"] = version.get("when")
+            # Add labels from content metadata
+            label_results = ((result.get("metadata") or {}).get("labels") or {}).get("results")
+            if label_results:
+                page_info["labels"] = [lbl.get("name") for lbl in label_results]
+            pages.append(page_info)
+    return format_response({"total": len(pages), "pages": pages})
+
+
+# Page bodies only change when version.number changes, so cache them on disk
+# keyed by (page_id, version) and skip the body transfer on repeated reads.
+_PAGE_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "ptrck-agent", "confluence_pages"
+)
+
+
+def _read_cached_page(page_id: str, version: int) -> Optional[dict]:
+    """Return the cached page dict if it matches the current version."""
+    try:
+        with open(os.path.join(_PAGE_CACHE_DIR, f"{page_id}.json")) as f:
+            cached = json.load(f)
+        if cached.get("version") == version:
+            return cached
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_cached_page(page_id: str, page: dict) -> None:
+    """Store a page dict in the on-disk cache (best effort)."""
+    try:
+        os.makedirs(_PAGE_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(_PAGE_CACHE_DIR, f"{page_id}.json"), 'w') as f:
+            json.dump(page, f, ensure_ascii=False)
+    except OSError:
+        pass
 
 
-def get_page(page_id: str) -> str:
+def get_page(page_id: str) -> bytes:
     """Get page content by ID."""
     try:
         base_url = get_base_url()
-        headers = get_auth_header()
+        session = get_session()
 
-        response = requests.get(
-            f"{base_url}/pages/{page_id}?body-format=storage",
-            headers=headers
-        )
+        # Lightweight metadata fetch first: if the version is unchanged we
+        # can serve the body from the on-disk cache without transferring it
+        meta_response = session.get(f"{base_url}/pages/{page_id}")
+        meta = handle_response(meta_response)
+        version = (meta.get("version") or {}).get("number")
+
+        cached = _read_cached_page(page_id, version)
+        if cached is not None:
+            return format_response(cached)
+
+        response = session.get(f"{base_url}/pages/{page_id}?body-format=storage")
         page = handle_response(response)
 
-        return format_response({
+        page_version = page.get("version") or {}
+        body_storage = (page.get("body") or {}).get("storage") or {}
+        links = page.get("_links") or {}
+        result = {
             "id": page.get("id"),
             "title": page.get("title"),
             "status": page.get("status"),
             "spaceId": page.get("spaceId"),
-            "version": page.get("version", {}).get("number"),
-            "body": page.get("body", {}).get("storage", {}).get("value"),
+            "version": page_version.get("number"),
+            "body": body_storage.get("value"),
             "_links": {
-                "webui": page.get("_links", {}).get("webui"),
+                "webui": links.get("webui"),
             }
-        })
+        }
+        _write_cached_page(page_id, result)
+        return format_response(result)
     except Exception as e:
         return format_error(str(e))
 
@@ -178,18 +358,15 @@ def create_page(
     title: str,
     content: str,
     parent_id: Optional[str] = None
-) -> str:
+) -> bytes:
     """Create a new page."""
     try:
+        _search_pages_cached.cache_clear()
         base_url = get_base_url()
-        headers = get_auth_header()
+        session = get_session()
 
-        # Get space ID from space key
-        space_response = requests.get(f"{base_url}/spaces?keys={space}", headers=headers)
-        space_data = handle_response(space_response)
-        if not space_data.get("results"):
-            raise Exception(f"Space '{space}' not found")
-        space_id = space_data["results"][0]["id"]
+        # Resolve space key to ID (cached after the first create in a space)
+        space_id = _resolve_space_id(space)
 
         body = {
             "spaceId": space_id,
@@ -204,7 +381,7 @@ def create_page(
         if parent_id:
             body["parentId"] = parent_id
 
-        response = requests.post(f"{base_url}/pages", headers=headers, json=body)
+        response = session.post(f"{base_url}/pages", json=body)
         result = handle_response(response)
 
         return format_response({
@@ -213,7 +390,7 @@ def create_page(
             "title": result.get("title"),
             "spaceId": result.get("spaceId"),
             "_links": {
-                "webui": result.get("_links", {}).get("webui"),
+                "webui": (result.get("_links") or {}).get("webui"),
             }
         })
     except Exception as e:
@@ -224,22 +401,20 @@ def update_page(
     page_id: str,
     title: Optional[str] = None,
     content: Optional[str] = None
-) -> str:
+) -> bytes:
     """Update an existing page."""
     try:
+        _search_pages_cached.cache_clear()
         base_url = get_base_url()
-        headers = get_auth_header()
+        session = get_session()
 
         # Get current page to get version and current values
-        current_response = requests.get(
-            f"{base_url}/pages/{page_id}?body-format=storage",
-            headers=headers
-        )
+        current_response = session.get(f"{base_url}/pages/{page_id}?body-format=storage")
         current = handle_response(current_response)
 
         new_title = title if title else current.get("title")
-        new_content = content if content else current.get("body", {}).get("storage", {}).get("value", "")
-        current_version = current.get("version", {}).get("number", 1)
+        new_content = content if content else ((current.get("body") or {}).get("storage") or {}).get("value", "")
+        current_version = (current.get("version") or {}).get("number", 1)
 
         body = {
             "id": page_id,
@@ -254,26 +429,78 @@ def update_page(
             }
         }
 
-        response = requests.put(f"{base_url}/pages/{page_id}", headers=headers, json=body)
+        response = session.put(f"{base_url}/pages/{page_id}", json=body)
         result = handle_response(response)
 
         return format_response({
             "success": True,
             "id": result.get("id"),
             "title": result.get("title"),
-            "version": result.get("version", {}).get("number"),
+            "version": (result.get("version") or {}).get("number"),
         })
     except Exception as e:
         return format_error(str(e))
 
 
-def delete_page(page_id: str) -> str:
+def bulk_update_pages(updates: List[dict]) -> bytes:
+    """Update many pages concurrently: all GETs in parallel, then all PUTs."""
+    try:
+        _search_pages_cached.cache_clear()
+        base_url = get_base_url()
+        session = get_session()
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            # Phase 1: fetch all current pages concurrently
+            currents = list(executor.map(
+                lambda u: session.get(f"{base_url}/pages/{u['page_id']}?body-format=storage"),
+                updates
+            ))
+
+            # Phase 2: build PUT bodies and send them concurrently
+            def put_update(update, current_response):
+                current = handle_response(current_response)
+                page_id = update['page_id']
+                body = {
+                    "id": page_id,
+                    "status": "current",
+                    "title": update.get("title") or current.get("title"),
+                    "body": {
+                        "representation": "storage",
+                        "value": update.get("content") or ((current.get("body") or {}).get("storage") or {}).get("value", ""),
+                    },
+                    "version": {
+                        "number": (current.get("version") or {}).get("number", 1) + 1
+                    }
+                }
+                return handle_response(session.put(f"{base_url}/pages/{page_id}", json=body))
+
+            results = []
+            for update, future in [(u, executor.submit(put_update, u, c))
+                                   for u, c in zip(updates, currents)]:
+                try:
+                    result = future.result()
+                    results.append({
+                        "success": True,
+                        "id": result.get("id"),
+                        "title": result.get("title"),
+                        "version": (result.get("version") or {}).get("number"),
+                    })
+                except Exception as e:
+                    results.append({"success": False, "id": update.get("page_id"), "error": str(e)})
+
+        return format_response({"total": len(results), "results": results})
+    except Exception as e:
+        return format_error(str(e))
+
+
+def delete_page(page_id: str) -> bytes:
     """Delete a page."""
     try:
+        _search_pages_cached.cache_clear()
         base_url = get_base_url()
-        headers = get_auth_header()
+        session = get_session()
 
-        response = requests.delete(f"{base_url}/pages/{page_id}", headers=headers)
+        response = session.delete(f"{base_url}/pages/{page_id}")
         if response.status_code == 204:
             return format_response({"success": True, "id": page_id, "deleted": True})
         handle_response(response)
@@ -282,7 +509,7 @@ def delete_page(page_id: str) -> str:
         return format_error(str(e))
 
 
-def list_spaces() -> str:
+def list_spaces() -> bytes:
     """List all available spaces."""
     try:
         cloud_id = os.environ.get('CONFLUENCE_CLOUD_ID')
@@ -291,13 +518,33 @@ def list_spaces() -> str:
 
         # Use v1 space API (works with read:confluence-space.summary scope)
         space_url = f"https://api.atlassian.com/ex/confluence/{cloud_id}/wiki/rest/api/space"
-        headers = get_auth_header()
+        session = get_session()
+        page_size = 250
 
-        response = requests.get(f"{space_url}?limit=250", headers=headers)
+        response = session.get(f"{space_url}?limit={page_size}&start=0")
         data = handle_response(response)
+        spaces = list(data.get("results", []))
+
+        # Tenants can have more than one page of spaces; fetch the remaining
+        # pages in concurrent waves of 4 until a short page signals the end
+        start = page_size
+        while data.get("_links", {}).get("next") or len(data.get("results", [])) == page_size:
+            starts = [start + i * page_size for i in range(4)]
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                batch = list(executor.map(
+                    lambda s: handle_response(
+                        session.get(f"{space_url}?limit={page_size}&start={s}")
+                    ),
+                    starts
+                ))
+            for data in batch:
+                spaces.extend(data.get("results", []))
+            if any(len(page.get("results", [])) < page_size for page in batch):
+                break
+            start += 4 * page_size
 
         result = []
-        for space in data.get("results", []):
+        for space in spaces:
             result.append({
                 "id": space.get("id"),
                 "key": space.get("key"),
@@ -309,6 +556,22 @@ def list_spaces() -> str:
         return format_error(str(e))
 
 
+def _prewarm():
+    """Open the pooled connection early so the first real call skips the
+    DNS + TCP + TLS handshake."""
+    try:
+        get_session().head(get_base_url(), timeout=5)
+    except Exception:
+        pass
+
+
+# One-shot CLI invocations pay the handshake before any useful work; start
+# it in the background while argparse and dispatch run. Opt-in so tests and
+# offline runs see no network side effects at import.
+if os.environ.get('CONFLUENCE_PREWARM') == '1':
+    threading.Thread(target=_prewarm, daemon=True).start()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Confluence API wrapper for Claude skills")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -326,6 +589,8 @@ def main():
     search_parser.add_argument("--modified-after", help="Modified after date (YYYY-MM-DD)")
     search_parser.add_argument("--sort", help="Sort order (e.g., 'lastmodified desc')")
     search_parser.add_argument("--limit", "-l", type=int, default=25, help="Max results")
+    search_parser.add_argument("--include-body", action="store_true",
+                               help="Include page bodies in results (skips per-page fetches)")
 
     # Get
     get_parser = subparsers.add_parser("get", help="Get page content")
@@ -344,6 +609,13 @@ def main():
     update_parser.add_argument("--title", "-t", help="New title")
     update_parser.add_argument("--content", "-c", help="New content")
 
+    # Bulk update
+    bulk_update_parser = subparsers.add_parser("bulk-update", help="Update many pages concurrently")
+    bulk_update_parser.add_argument(
+        "updates_file",
+        help="JSON file with a list of {page_id, title, content} objects ('-' for stdin)"
+    )
+
     # Delete
     delete_parser = subparsers.add_parser("delete", help="Delete a page")
     delete_parser.add_argument("page_id", help="Page ID")
@@ -359,9 +631,9 @@ def main():
 
     try:
         if args.command == "test":
-            print(test_connection())
+            emit(test_connection())
         elif args.command == "search":
-            print(search_pages(
+            emit(search_pages(
                 args.query,
                 args.space,
                 args.labels,
@@ -369,20 +641,28 @@ def main():
                 getattr(args, 'created_after', None),
                 getattr(args, 'modified_after', None),
                 args.sort,
-                args.limit
+                args.limit,
+                args.include_body
             ))
         elif args.command == "get":
-            print(get_page(args.page_id))
+            emit(get_page(args.page_id))
         elif args.command == "create":
-            print(create_page(args.space, args.title, args.content, args.parent))
+            emit(create_page(args.space, args.title, args.content, args.parent))
         elif args.command == "update":
-            print(update_page(args.page_id, args.title, args.content))
+            emit(update_page(args.page_id, args.title, args.content))
+        elif args.command == "bulk-update":
+            if args.updates_file == "-":
+                updates = json.load(sys.stdin)
+            else:
+                with open(args.updates_file) as f:
+                    updates = json.load(f)
+            emit(bulk_update_pages(updates))
         elif args.command == "delete":
-            print(delete_page(args.page_id))
+            emit(delete_page(args.page_id))
         elif args.command == "spaces":
-            print(list_spaces())
+            emit(list_spaces())
     except Exception as e:
-        print(format_error(str(e)))
+        emit(format_error(str(e)))
         sys.exit(1)
 
 
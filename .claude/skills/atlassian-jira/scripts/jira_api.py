@@ -1,32 +1,89 @@
 #!/usr/bin/env python3
 """
 Jira API wrapper for Claude skills.
-Uses atlassian-python-api with support for scoped API tokens.
+Calls the Jira Cloud REST API directly with support for scoped API tokens.
 """
 
 import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from atlassian import Jira
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-def get_jira_client() -> Jira:
-    """Create Jira client using JIRA_* environment variables."""
-    email = os.environ.get('JIRA_EMAIL')
-    token = os.environ.get('JIRA_API_TOKEN')
-    cloud_id = os.environ.get('JIRA_CLOUD_ID')
+# Thin REST client: the atlassian package added a thick marshalling layer
+# (and a heavy import tree) on top of requests for the handful of endpoints
+# used here. A shared session with Basic auth covers them directly.
+_SESSION = None
+
+
+def get_session():
+    """Get the shared requests session, built with Basic auth on first use."""
+    global _SESSION
+    if _SESSION is None:
+        # Deferred import so --help and argparse errors skip requests/urllib3
+        import requests
+
+        email = os.environ.get('JIRA_EMAIL')
+        token = os.environ.get('JIRA_API_TOKEN')
+
+        if not email or not token:
+            raise ValueError("JIRA_EMAIL and JIRA_API_TOKEN are required")
 
-    if not email or not token:
-        raise ValueError("JIRA_EMAIL and JIRA_API_TOKEN are required")
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16
+        ))
+        _SESSION.auth = (email, token)
+        _SESSION.headers["Content-Type"] = "application/json"
+    return _SESSION
 
+
+def get_base_url() -> str:
+    """Get the scoped-token base URL for API requests."""
+    cloud_id = os.environ.get('JIRA_CLOUD_ID')
     if not cloud_id:
         raise ValueError("JIRA_CLOUD_ID is required")
+    return f"https://api.atlassian.com/ex/jira/{cloud_id}"
+
+
+def _request(method: str, path: str, body=None, params=None) -> dict:
+    """Issue a REST call and return the parsed JSON body."""
+    data = None
+    if body is not None:
+        data = orjson.dumps(body) if orjson is not None else json.dumps(body).encode()
+    response = get_session().request(
+        method, f"{get_base_url()}{path}", data=data, params=params
+    )
+    if response.status_code >= 400:
+        raise Exception(f"{response.status_code}: {response.text}")
+    if response.status_code == 204 or not response.content:
+        return {}
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
 
-    url = f"https://api.atlassian.com/ex/jira/{cloud_id}"
-    return Jira(url=url, username=email, password=token)
+def _get(path: str, params=None) -> dict:
+    return _request("GET", path, params=params)
+
+
+def _post(path: str, body=None) -> dict:
+    return _request("POST", path, body=body)
+
+
+def _put(path: str, body=None) -> dict:
+    return _request("PUT", path, body=body)
+
+
+def _delete(path: str) -> dict:
+    return _request("DELETE", path)
 
 
 def get_token_type() -> str:
@@ -35,23 +92,45 @@ def get_token_type() -> str:
     return f"scoped (api.atlassian.com/ex/jira/{cloud_id})"
 
 
-def format_response(data) -> str:
-    """Format response as JSON."""
-    return json.dumps(data, ensure_ascii=False, indent=2)
+# Indent only when a human is watching; piped output (the common case when
+# Claude consumes it) is smaller and faster compact
+_INDENT_OUTPUT = sys.stdout.isatty()
+
+
+def format_response(data) -> bytes:
+    """Format response as JSON bytes (indented only on a TTY)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _INDENT_OUTPUT else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(
+        data, ensure_ascii=False, indent=2 if _INDENT_OUTPUT else None
+    ).encode('utf-8')
+
 
+def format_error(message: str) -> bytes:
+    """Format error as JSON bytes."""
+    return format_response({"error": message})
 
-def format_error(message: str) -> str:
-    """Format error as JSON."""
-    return json.dumps({"error": message}, ensure_ascii=False, indent=2)
+
+def emit(payload: bytes) -> None:
+    """Write a formatted payload straight to stdout's byte buffer."""
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _nested(fields: dict, key: str, attr: str = "name"):
+    """Extract a nested attribute like fields.status.name, evaluating the
+    outer lookup once instead of twice per field."""
+    value = fields.get(key)
+    return value.get(attr) if value else None
 
 
 # Commands
 
-def test_connection() -> str:
+def test_connection() -> bytes:
     """Test connection and show token info."""
     try:
-        jira = get_jira_client()
-        myself = jira.myself()
+        myself = _get("/rest/api/2/myself")
         return format_response({
             "success": True,
             "token_type": get_token_type(),
@@ -65,42 +144,62 @@ def test_connection() -> str:
         return format_error(str(e))
 
 
-def search_issues(jql: str, limit: int = 50) -> str:
+def search_issues(jql: str, limit: int = 50) -> bytes:
     """Search issues using JQL."""
     try:
-        jira = get_jira_client()
-        results = jira.jql(jql, limit=limit)
-        issues = []
-        for issue in results.get("issues", []):
-            fields = issue.get("fields", {})
-            issues.append({
+        # Only request the fields we output — large JQL result sets are
+        # dominated by payload size otherwise. Jira Cloud caps maxResults
+        # at 100 per page, so page explicitly for larger limits.
+        raw_issues = []
+        total = 0
+        start_at = 0
+        while len(raw_issues) < limit:
+            page = _get("/rest/api/2/search", params={
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": min(100, limit - len(raw_issues)),
+                "fields": "summary,status,assignee,priority,issuetype",
+            })
+            total = page.get("total", 0)
+            batch = page.get("issues", [])
+            if not batch:
+                break
+            raw_issues.extend(batch)
+            start_at += len(batch)
+            if start_at >= total:
+                break
+
+        issues = [
+            {
                 "key": issue.get("key"),
                 "summary": fields.get("summary"),
-                "status": fields.get("status", {}).get("name") if fields.get("status") else None,
-                "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None,
-                "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
-                "issuetype": fields.get("issuetype", {}).get("name") if fields.get("issuetype") else None,
-            })
-        return format_response({"total": results.get("total", 0), "issues": issues})
+                "status": _nested(fields, "status"),
+                "assignee": _nested(fields, "assignee", "displayName"),
+                "priority": _nested(fields, "priority"),
+                "issuetype": _nested(fields, "issuetype"),
+            }
+            for issue in raw_issues
+            for fields in (issue.get("fields", {}),)
+        ]
+        return format_response({"total": total, "issues": issues})
     except Exception as e:
         return format_error(str(e))
 
 
-def get_issue(key: str) -> str:
+def get_issue(key: str) -> bytes:
     """Get issue details by key."""
     try:
-        jira = get_jira_client()
-        issue = jira.issue(key)
+        issue = _get(f"/rest/api/2/issue/{key}")
         fields = issue.get("fields", {})
         return format_response({
             "key": issue.get("key"),
             "summary": fields.get("summary"),
             "description": fields.get("description"),
-            "status": fields.get("status", {}).get("name") if fields.get("status") else None,
-            "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None,
-            "reporter": fields.get("reporter", {}).get("displayName") if fields.get("reporter") else None,
-            "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
-            "issuetype": fields.get("issuetype", {}).get("name") if fields.get("issuetype") else None,
+            "status": _nested(fields, "status"),
+            "assignee": _nested(fields, "assignee", "displayName"),
+            "reporter": _nested(fields, "reporter", "displayName"),
+            "priority": _nested(fields, "priority"),
+            "issuetype": _nested(fields, "issuetype"),
             "created": fields.get("created"),
             "updated": fields.get("updated"),
             "labels": fields.get("labels", []),
@@ -119,10 +218,9 @@ def create_issue(
     assignee: Optional[str] = None,
     labels: Optional[list] = None,
     components: Optional[list] = None
-) -> str:
+) -> bytes:
     """Create a new issue."""
     try:
-        jira = get_jira_client()
         fields = {
             "project": {"key": project},
             "issuetype": {"name": issue_type},
@@ -139,7 +237,7 @@ def create_issue(
         if components:
             fields["components"] = [{"name": c} for c in components]
 
-        result = jira.create_issue(fields=fields)
+        result = _post("/rest/api/2/issue", {"fields": fields})
         return format_response({
             "success": True,
             "key": result.get("key"),
@@ -158,10 +256,9 @@ def update_issue(
     assignee: Optional[str] = None,
     labels: Optional[list] = None,
     components: Optional[list] = None
-) -> str:
+) -> bytes:
     """Update an existing issue."""
     try:
-        jira = get_jira_client()
         fields = {}
         if summary:
             fields["summary"] = summary
@@ -179,27 +276,25 @@ def update_issue(
         if not fields:
             return format_error("No update fields provided")
 
-        jira.update_issue_field(key, fields)
+        _put(f"/rest/api/2/issue/{key}", {"fields": fields})
         return format_response({"success": True, "key": key})
     except Exception as e:
         return format_error(str(e))
 
 
-def delete_issue(key: str) -> str:
+def delete_issue(key: str) -> bytes:
     """Delete an issue."""
     try:
-        jira = get_jira_client()
-        jira.delete_issue(key)
+        _delete(f"/rest/api/2/issue/{key}")
         return format_response({"success": True, "key": key, "deleted": True})
     except Exception as e:
         return format_error(str(e))
 
 
-def add_comment(key: str, body: str) -> str:
+def add_comment(key: str, body: str) -> bytes:
     """Add a comment to an issue."""
     try:
-        jira = get_jira_client()
-        result = jira.issue_add_comment(key, body)
+        result = _post(f"/rest/api/2/issue/{key}/comment", {"body": body})
         return format_response({
             "success": True,
             "key": key,
@@ -209,33 +304,32 @@ def add_comment(key: str, body: str) -> str:
         return format_error(str(e))
 
 
-def transition_issue(key: str, state: str) -> str:
+def transition_issue(key: str, state: str) -> bytes:
     """Transition an issue to a new state."""
     try:
-        jira = get_jira_client()
-        # Get available transitions
-        transitions = jira.get_issue_transitions(key)
-        target_transition = None
-        for t in transitions:
-            if t.get("name", "").lower() == state.lower():
-                target_transition = t
-                break
+        # Get available transitions and index them by lowercased name once
+        transitions = _get(f"/rest/api/2/issue/{key}/transitions").get("transitions", [])
+        by_name = {t.get("name", "").lower(): t for t in transitions}
+        target_transition = by_name.get(state.lower())
 
         if not target_transition:
             available = [t.get("name") for t in transitions]
             return format_error(f"Transition '{state}' not found. Available: {available}")
 
-        jira.set_issue_status(key, target_transition["name"])
+        _post(f"/rest/api/2/issue/{key}/transitions",
+              {"transition": {"id": target_transition["id"]}})
         return format_response({"success": True, "key": key, "status": state})
     except Exception as e:
         return format_error(str(e))
 
 
-def add_worklog(key: str, time_spent: str, comment: Optional[str] = None) -> str:
+def add_worklog(key: str, time_spent: str, comment: Optional[str] = None) -> bytes:
     """Add a worklog entry to an issue."""
     try:
-        jira = get_jira_client()
-        result = jira.issue_worklog(key, timeSpent=time_spent, comment=comment)
+        body = {"timeSpent": time_spent}
+        if comment:
+            body["comment"] = comment
+        result = _post(f"/rest/api/2/issue/{key}/worklog", body)
         return format_response({
             "success": True,
             "key": key,
@@ -246,15 +340,14 @@ def add_worklog(key: str, time_spent: str, comment: Optional[str] = None) -> str
         return format_error(str(e))
 
 
-def link_issues(inward_key: str, outward_key: str, link_type: str = "relates to") -> str:
+def link_issues(inward_key: str, outward_key: str, link_type: str = "relates to") -> bytes:
     """Link two issues together."""
     try:
-        jira = get_jira_client()
-        jira.create_issue_link(
-            type=link_type,
-            inwardIssue=inward_key,
-            outwardIssue=outward_key
-        )
+        _post("/rest/api/2/issueLink", {
+            "type": {"name": link_type},
+            "inwardIssue": {"key": inward_key},
+            "outwardIssue": {"key": outward_key},
+        })
         return format_response({
             "success": True,
             "inward_key": inward_key,
@@ -265,13 +358,17 @@ def link_issues(inward_key: str, outward_key: str, link_type: str = "relates to"
         return format_error(str(e))
 
 
-def add_to_epic(epic_key: str, issue_keys: list) -> str:
+def add_to_epic(epic_key: str, issue_keys: list) -> bytes:
     """Add issues to an epic."""
     try:
-        jira = get_jira_client()
-        # The epic link field name varies by instance
-        for issue_key in issue_keys:
-            jira.update_issue_field(issue_key, {"parent": {"key": epic_key}})
+        # The epic link field name varies by instance. Updates are
+        # independent, so issue them concurrently instead of N serial calls.
+        with ThreadPoolExecutor(max_workers=min(16, len(issue_keys))) as executor:
+            list(executor.map(
+                lambda key: _put(f"/rest/api/2/issue/{key}",
+                                 {"fields": {"parent": {"key": epic_key}}}),
+                issue_keys
+            ))
         return format_response({
             "success": True,
             "epic_key": epic_key,
@@ -281,11 +378,11 @@ def add_to_epic(epic_key: str, issue_keys: list) -> str:
         return format_error(str(e))
 
 
-def list_sprints(board_id: int, state: Optional[str] = None) -> str:
+def list_sprints(board_id: int, state: Optional[str] = None) -> bytes:
     """List sprints for a board."""
     try:
-        jira = get_jira_client()
-        sprints = jira.get_all_sprints_from_board(board_id, state=state)
+        params = {"state": state} if state else None
+        sprints = _get(f"/rest/agile/1.0/board/{board_id}/sprint", params=params).get("values", [])
         result = []
         for sprint in sprints:
             result.append({
@@ -300,6 +397,54 @@ def list_sprints(board_id: int, state: Optional[str] = None) -> str:
         return format_error(str(e))
 
 
+# Command dispatch table, shared by one-shot main() and serve mode
+DISPATCH = {
+    "test": lambda a: test_connection(),
+    "search": lambda a: search_issues(a.jql, a.limit),
+    "get": lambda a: get_issue(a.key),
+    "create": lambda a: create_issue(
+        a.project, a.type, a.summary, a.description,
+        a.priority, a.assignee, a.labels, a.components
+    ),
+    "update": lambda a: update_issue(
+        a.key, a.summary, a.description,
+        a.priority, a.assignee, a.labels, a.components
+    ),
+    "delete": lambda a: delete_issue(a.key),
+    "comment": lambda a: add_comment(a.key, a.body),
+    "transition": lambda a: transition_issue(a.key, a.state),
+    "worklog": lambda a: add_worklog(a.key, a.time, a.comment),
+    "link": lambda a: link_issues(a.inward_key, a.outward_key, a.type),
+    "epic-add": lambda a: add_to_epic(a.epic_key, a.issue_keys),
+    "sprints": lambda a: list_sprints(a.board, a.state),
+}
+
+
+def serve(parser: argparse.ArgumentParser) -> None:
+    """Process newline-delimited JSON command lines from stdin.
+
+    Each line is a JSON array of CLI tokens (e.g. ["get", "PROJ-123"]);
+    one response is emitted per line. Running many commands in a single
+    process amortizes interpreter startup, imports, parser construction
+    and the TLS handshake that one-shot invocations pay every time.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            tokens = json.loads(line)
+            cmd_args = parser.parse_args(tokens)
+            if cmd_args.command in DISPATCH:
+                emit(DISPATCH[cmd_args.command](cmd_args))
+            else:
+                emit(format_error(f"Unknown command: {cmd_args.command}"))
+        except SystemExit:
+            emit(format_error(f"Invalid command line: {line}"))
+        except Exception as e:
+            emit(format_error(str(e)))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Jira API wrapper for Claude skills")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -373,46 +518,23 @@ def main():
     sprint_parser.add_argument("--board", "-b", type=int, required=True, help="Board ID")
     sprint_parser.add_argument("--state", "-s", help="Sprint state filter (active, future, closed)")
 
+    # Serve
+    subparsers.add_parser("serve", help="Read JSON command lines from stdin (long-running mode)")
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    if args.command == "serve":
+        serve(parser)
+        return
+
     try:
-        if args.command == "test":
-            print(test_connection())
-        elif args.command == "search":
-            print(search_issues(args.jql, args.limit))
-        elif args.command == "get":
-            print(get_issue(args.key))
-        elif args.command == "create":
-            print(create_issue(
-                args.project, args.type, args.summary,
-                args.description, args.priority, args.assignee,
-                args.labels, args.components
-            ))
-        elif args.command == "update":
-            print(update_issue(
-                args.key, args.summary, args.description,
-                args.priority, args.assignee, args.labels, args.components
-            ))
-        elif args.command == "delete":
-            print(delete_issue(args.key))
-        elif args.command == "comment":
-            print(add_comment(args.key, args.body))
-        elif args.command == "transition":
-            print(transition_issue(args.key, args.state))
-        elif args.command == "worklog":
-            print(add_worklog(args.key, args.time, args.comment))
-        elif args.command == "link":
-            print(link_issues(args.inward_key, args.outward_key, args.type))
-        elif args.command == "epic-add":
-            print(add_to_epic(args.epic_key, args.issue_keys))
-        elif args.command == "sprints":
-            print(list_sprints(args.board, args.state))
+        emit(DISPATCH[args.command](args))
     except Exception as e:
-        print(format_error(str(e)))
+        emit(format_error(str(e)))
         sys.exit(1)
 
 
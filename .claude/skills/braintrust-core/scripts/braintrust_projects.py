@@ -8,24 +8,64 @@ import os
 import sys
 import json
 import argparse
-import requests
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE_URL = "https://api.braintrust.dev"
 
+# Indent only when a human is watching; piped output is smaller compact
+_INDENT_OUTPUT = sys.stdout.isatty()
+
+def dump_json(obj) -> bytes:
+    """Serialize to JSON bytes, indented only on a TTY (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _INDENT_OUTPUT else 0)
+    return json.dumps(obj, indent=2 if _INDENT_OUTPUT else None).encode()
+
+def serialize_body(data) -> Optional[bytes]:
+    """Pre-serialize a request body so requests doesn't json.dumps it again"""
+    if data is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def parse_json(raw: bytes):
+    """Parse JSON from raw response bytes without an intermediate str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(obj) -> None:
+    """Write JSON straight to stdout's byte buffer, skipping print's re-encode"""
+    sys.stdout.buffer.write(dump_json(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+_ENV_LOADED = False
+
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if key not in os.environ:
-                        os.environ[key] = value
-
+        # Single read + partition: cheaper than per-line text iteration and
+        # runs exactly once thanks to the module flag
+        for line in env_path.read_bytes().split(b"\n"):
+            line = line.strip()
+            if line and line[:1] != b"#" and b"=" in line:
+                key, _, value = line.partition(b"=")
+                os.environ.setdefault(key.decode(), value.decode())
+
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get the Braintrust API key from environment"""
     load_env()
@@ -34,34 +74,55 @@ def get_api_key() -> str:
         raise ValueError("BRAINTRUST_API_KEY environment variable not set")
     return api_key
 
+# Shared session so back-to-back API calls reuse the pooled TLS connection.
+# Built lazily so importing requests (~100ms) is skipped for --help paths.
+_SESSION = None
+
+def get_session():
+    """Get the shared session, constructed with auth headers on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        _SESSION.headers.update({
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json"
+        })
+    return _SESSION
+
+# Full error-response bodies are only decoded when explicitly requested
+_DEBUG = os.environ.get("BRAINTRUST_DEBUG") == "1"
+
 def make_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
     """Make an authenticated request to the Braintrust API"""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
+    import requests
+    session = get_session()
     url = f"{API_BASE_URL}{endpoint}"
 
     try:
         if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
+            response = session.get(url, params=params)
         elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
+            response = session.post(url, data=serialize_body(data))
         elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data)
+            response = session.patch(url, data=serialize_body(data))
         elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
+            response = session.delete(url)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
         response.raise_for_status()
-        return response.json() if response.text else {}
+        return parse_json(response.content) if response.content else {}
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}", file=sys.stderr)
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response: {e.response.text}", file=sys.stderr)
+        response = getattr(e, 'response', None)
+        if response is not None:
+            if _DEBUG:
+                print(f"Response: {response.text}", file=sys.stderr)
+            else:
+                # Skip decoding the body unless explicitly debugging
+                print(f"Response: {response.status_code} {response.reason}", file=sys.stderr)
         sys.exit(1)
 
 def list_projects(org_name: Optional[str] = None, limit: int = 100) -> None:
@@ -71,12 +132,12 @@ def list_projects(org_name: Optional[str] = None, limit: int = 100) -> None:
         params["org_name"] = org_name
 
     result = make_request("GET", "/v1/project", params=params)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def get_project(project_id: str) -> None:
     """Get a specific project by ID"""
     result = make_request("GET", f"/v1/project/{project_id}")
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def create_project(name: str, org_name: Optional[str] = None) -> None:
     """Create a new project"""
@@ -88,7 +149,7 @@ def create_project(name: str, org_name: Optional[str] = None) -> None:
         data["org_name"] = org_name
 
     result = make_request("POST", "/v1/project", data=data)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def update_project(project_id: str, name: Optional[str] = None) -> None:
     """Update an existing project"""
@@ -102,12 +163,12 @@ def update_project(project_id: str, name: Optional[str] = None) -> None:
         sys.exit(1)
 
     result = make_request("PATCH", f"/v1/project/{project_id}", data=data)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def delete_project(project_id: str) -> None:
     """Delete a project"""
     result = make_request("DELETE", f"/v1/project/{project_id}")
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def main():
     parser = argparse.ArgumentParser(description="Manage Braintrust projects")
@@ -142,17 +203,16 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    dispatch = {
+        "list": lambda a: list_projects(a.org_name, a.limit),
+        "get": lambda a: get_project(a.project_id),
+        "create": lambda a: create_project(a.name, a.org_name),
+        "update": lambda a: update_project(a.project_id, a.name),
+        "delete": lambda a: delete_project(a.project_id),
+    }
+
     try:
-        if args.command == "list":
-            list_projects(args.org_name, args.limit)
-        elif args.command == "get":
-            get_project(args.project_id)
-        elif args.command == "create":
-            create_project(args.name, args.org_name)
-        elif args.command == "update":
-            update_project(args.project_id, args.name)
-        elif args.command == "delete":
-            delete_project(args.project_id)
+        dispatch[args.command](args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -10,6 +10,48 @@ import argparse
 import subprocess
 from typing import List, Optional
 
+
+def _run_cli_in_process(cli_args: List[str]) -> Optional[int]:
+    """Run the braintrust CLI via the library, or None if it isn't importable."""
+    try:
+        from braintrust.cli.__main__ import main as cli_main
+    except ImportError:
+        return None
+
+    old_argv = sys.argv
+    sys.argv = ["braintrust"] + cli_args
+    try:
+        code = cli_main()
+        return code if isinstance(code, int) else 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        sys.argv = old_argv
+
+
+def run_cli(cli_args: List[str], action: str) -> int:
+    """Run a braintrust CLI command and return its exit code.
+
+    Prefers dispatching into the installed braintrust package in-process,
+    which skips a fresh interpreter launch (and its module imports) per
+    invocation. Falls back to the standalone CLI on PATH when the package
+    isn't importable. Returning the code instead of exiting keeps repeated
+    invocations from one process possible.
+    """
+    code = _run_cli_in_process(cli_args)
+    if code is not None:
+        return code
+
+    try:
+        result = subprocess.run(["braintrust"] + cli_args, check=False)
+        return result.returncode
+    except FileNotFoundError:
+        print("Error: braintrust CLI not found. Please install it with: pip install braintrust", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error {action}: {e}", file=sys.stderr)
+        return 1
+
 def run_eval(
     files: List[str],
     watch: bool = False,
@@ -28,10 +70,10 @@ def run_eval(
     dev_host: Optional[str] = None,
     dev_port: Optional[int] = None,
     dev_org_name: Optional[str] = None
-) -> None:
-    """Run Braintrust evaluations"""
+) -> int:
+    """Run Braintrust evaluations, returning the CLI exit code"""
 
-    cmd = ["braintrust", "eval"]
+    cmd = ["eval"]
 
     # Add verbosity
     if verbose > 0:
@@ -95,15 +137,7 @@ def run_eval(
     # Add files
     cmd.extend(files)
 
-    try:
-        result = subprocess.run(cmd, check=False)
-        sys.exit(result.returncode)
-    except FileNotFoundError:
-        print("Error: braintrust CLI not found. Please install it with: pip install braintrust", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error running evaluation: {e}", file=sys.stderr)
-        sys.exit(1)
+    return run_cli(cmd, "running evaluation")
 
 def push_code(
     file: str,
@@ -112,10 +146,10 @@ def push_code(
     verbose: int = 0,
     api_key: Optional[str] = None,
     org_name: Optional[str] = None
-) -> None:
-    """Push code to Braintrust"""
+) -> int:
+    """Push code to Braintrust, returning the CLI exit code"""
 
-    cmd = ["braintrust", "push"]
+    cmd = ["push"]
 
     # Add verbosity
     if verbose > 0:
@@ -139,15 +173,7 @@ def push_code(
     # Add file
     cmd.append(file)
 
-    try:
-        result = subprocess.run(cmd, check=False)
-        sys.exit(result.returncode)
-    except FileNotFoundError:
-        print("Error: braintrust CLI not found. Please install it with: pip install braintrust", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error pushing code: {e}", file=sys.stderr)
-        sys.exit(1)
+    return run_cli(cmd, "pushing code")
 
 def main():
     parser = argparse.ArgumentParser(description="Run Braintrust evaluations and push code")
@@ -190,7 +216,7 @@ def main():
 
     try:
         if args.command == "eval":
-            run_eval(
+            code = run_eval(
                 files=args.files if args.files else ["."],
                 watch=args.watch,
                 filters=args.filters,
@@ -210,7 +236,7 @@ def main():
                 dev_org_name=args.dev_org_name
             )
         elif args.command == "push":
-            push_code(
+            code = push_code(
                 file=args.file,
                 if_exists=args.if_exists,
                 requirements=args.requirements,
@@ -218,6 +244,7 @@ def main():
                 api_key=args.api_key,
                 org_name=args.org_name
             )
+        sys.exit(code)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
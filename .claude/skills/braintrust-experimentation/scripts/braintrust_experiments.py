@@ -8,24 +8,64 @@ import os
 import sys
 import json
 import argparse
-import requests
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE_URL = "https://api.braintrust.dev"
 
+# Indent only when a human is watching; piped output is smaller compact
+_INDENT_OUTPUT = sys.stdout.isatty()
+
+def dump_json(obj) -> bytes:
+    """Serialize to JSON bytes, indented only on a TTY (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _INDENT_OUTPUT else 0)
+    return json.dumps(obj, indent=2 if _INDENT_OUTPUT else None).encode()
+
+def serialize_body(data) -> Optional[bytes]:
+    """Pre-serialize a request body so requests doesn't json.dumps it again"""
+    if data is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def parse_json(raw: bytes):
+    """Parse JSON from raw response bytes without an intermediate str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(obj) -> None:
+    """Write JSON straight to stdout's byte buffer, skipping print's re-encode"""
+    sys.stdout.buffer.write(dump_json(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+_ENV_LOADED = False
+
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if key not in os.environ:
-                        os.environ[key] = value
-
+        # Single read + partition: cheaper than per-line text iteration and
+        # runs exactly once thanks to the module flag
+        for line in env_path.read_bytes().split(b"\n"):
+            line = line.strip()
+            if line and line[:1] != b"#" and b"=" in line:
+                key, _, value = line.partition(b"=")
+                os.environ.setdefault(key.decode(), value.decode())
+
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get the Braintrust API key from environment"""
     load_env()
@@ -34,30 +74,43 @@ def get_api_key() -> str:
         raise ValueError("BRAINTRUST_API_KEY environment variable not set")
     return api_key
 
+# Shared session so back-to-back API calls reuse the pooled TLS connection.
+# Built lazily so importing requests (~100ms) is skipped for --help paths.
+_SESSION = None
+
+def get_session():
+    """Get the shared session, constructed with auth headers on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        _SESSION.headers.update({
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json"
+        })
+    return _SESSION
+
 def make_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
     """Make an authenticated request to the Braintrust API"""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
+    import requests
+    session = get_session()
     url = f"{API_BASE_URL}{endpoint}"
 
     try:
         if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
+            response = session.get(url, params=params)
         elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
+            response = session.post(url, data=serialize_body(data))
         elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data)
+            response = session.patch(url, data=serialize_body(data))
         elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
+            response = session.delete(url)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
         response.raise_for_status()
-        return response.json() if response.text else {}
+        return parse_json(response.content) if response.content else {}
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}", file=sys.stderr)
         if hasattr(e, 'response') and e.response is not None:
@@ -91,12 +144,12 @@ def list_experiments(project_id: Optional[str] = None, limit: int = 100) -> None
         params["project_id"] = project_id
 
     result = make_request("GET", "/v1/experiment", params=params)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def get_experiment(experiment_id: str) -> None:
     """Get a specific experiment by ID"""
     result = make_request("GET", f"/v1/experiment/{experiment_id}")
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def create_experiment(name: str, project_id: str, description: Optional[str] = None, dataset_id: Optional[str] = None) -> None:
     """Create a new experiment"""
@@ -111,7 +164,7 @@ def create_experiment(name: str, project_id: str, description: Optional[str] = N
         data["dataset_id"] = dataset_id
 
     result = make_request("POST", "/v1/experiment", data=data)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def update_experiment(experiment_id: str, name: Optional[str] = None, description: Optional[str] = None) -> None:
     """Update an existing experiment"""
@@ -127,12 +180,12 @@ def update_experiment(experiment_id: str, name: Optional[str] = None, descriptio
         sys.exit(1)
 
     result = make_request("PATCH", f"/v1/experiment/{experiment_id}", data=data)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def delete_experiment(experiment_id: str) -> None:
     """Delete an experiment"""
     result = make_request("DELETE", f"/v1/experiment/{experiment_id}")
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def insert_events(experiment_id: str, events_file: str, tags: Optional[List[str]] = None) -> None:
     """Insert events into an experiment from a JSON file
@@ -143,11 +196,18 @@ def insert_events(experiment_id: str, events_file: str, tags: Optional[List[str]
         tags: Optional list of tags to apply to all events in this batch
     """
     try:
-        with open(events_file, 'r') as f:
-            events = json.load(f)
+        # Read raw bytes once and parse with orjson when available; avoids
+        # json.load's str decode on large event files
+        with open(events_file, 'rb') as f:
+            raw = f.read()
 
-        if not isinstance(events, list):
-            events = [events]
+        try:
+            events = parse_json(raw)
+            if not isinstance(events, list):
+                events = [events]
+        except ValueError:
+            # Fall back to newline-delimited JSON: one event per line
+            events = [parse_json(line) for line in raw.splitlines() if line.strip()]
 
         # Apply tags to all events if provided (and event doesn't already have tags)
         if tags:
@@ -160,11 +220,11 @@ def insert_events(experiment_id: str, events_file: str, tags: Optional[List[str]
         }
 
         result = make_request("POST", f"/v1/experiment/{experiment_id}/insert", data=data)
-        print(json.dumps(result, indent=2))
+        print_json(result)
     except FileNotFoundError:
         print(f"Error: File not found: {events_file}", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"Error: Invalid JSON in file: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -175,7 +235,7 @@ def summarize_experiment(experiment_id: str, summarize_scores: bool = True) -> N
     }
 
     result = make_request("GET", f"/v1/experiment/{experiment_id}/summarize", params=params)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def main():
     parser = argparse.ArgumentParser(description="Manage Braintrust experiments")
@@ -224,22 +284,18 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    dispatch = {
+        "list": lambda a: list_experiments(a.project_id, a.limit),
+        "get": lambda a: get_experiment(a.experiment_id),
+        "create": lambda a: create_experiment(a.name, a.project_id, a.description, a.dataset_id),
+        "update": lambda a: update_experiment(a.experiment_id, a.name, a.description),
+        "delete": lambda a: delete_experiment(a.experiment_id),
+        "insert": lambda a: insert_events(a.experiment_id, a.file, parse_tags(getattr(a, 'tags', None))),
+        "summarize": lambda a: summarize_experiment(a.experiment_id, a.summarize_scores),
+    }
+
     try:
-        if args.command == "list":
-            list_experiments(args.project_id, args.limit)
-        elif args.command == "get":
-            get_experiment(args.experiment_id)
-        elif args.command == "create":
-            create_experiment(args.name, args.project_id, args.description, args.dataset_id)
-        elif args.command == "update":
-            update_experiment(args.experiment_id, args.name, args.description)
-        elif args.command == "delete":
-            delete_experiment(args.experiment_id)
-        elif args.command == "insert":
-            tags = parse_tags(args.tags) if hasattr(args, 'tags') else None
-            insert_events(args.experiment_id, args.file, tags)
-        elif args.command == "summarize":
-            summarize_experiment(args.experiment_id, args.summarize_scores)
+        dispatch[args.command](args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
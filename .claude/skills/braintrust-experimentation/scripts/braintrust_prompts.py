@@ -5,40 +5,93 @@ CRUD operations for Braintrust prompts via the REST API
 """
 
 import os
+import re
 import sys
 import json
 import argparse
-import requests
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE_URL = "https://api.braintrust.dev"
 
+# Slug sanitization tables, built once: translate deletes disallowed chars
+# with a C-level table lookup and the compiled regex collapses hyphen runs
+# in a single pass. The table only spans Latin-1, so a catch-all regex
+# strips any higher codepoints that translate passes through unchanged.
+_SLUG_TABLE = {i: None for i in range(256)}
+for _c in "abcdefghijklmnopqrstuvwxyz0123456789-":
+    _SLUG_TABLE[ord(_c)] = _c
+_NON_SLUG_RE = re.compile(r"[^a-z0-9-]")
+_HYPHEN_RUN_RE = re.compile(r"-{2,}")
+
+# Indent only when a human is watching; piped output is smaller compact
+_INDENT_OUTPUT = sys.stdout.isatty()
+
+def dump_json(obj) -> bytes:
+    """Serialize to JSON bytes, indented only on a TTY (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _INDENT_OUTPUT else 0)
+    return json.dumps(obj, indent=2 if _INDENT_OUTPUT else None).encode()
+
+def serialize_body(data) -> Optional[bytes]:
+    """Pre-serialize a request body so requests doesn't json.dumps it again"""
+    if data is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def parse_json(raw):
+    """Parse JSON from raw response bytes without an intermediate str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(obj) -> None:
+    """Write JSON straight to stdout's byte buffer, skipping print's re-encode"""
+    sys.stdout.buffer.write(dump_json(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
 
 def parse_tags(tags: Optional[str]) -> Optional[list]:
     """Parse tags from CLI argument. Returns None if no tags provided."""
     if tags is None:
         return None
-    try:
-        parsed = json.loads(tags)
-        return parsed if isinstance(parsed, list) else [parsed]
-    except json.JSONDecodeError:
-        return [tags] if tags else []
+    # Only attempt a JSON parse when the string can possibly be one; bare tag
+    # names skip the parser and its exception construction entirely
+    if tags[:1] in ('[', '"', '{'):
+        try:
+            parsed = parse_json(tags)
+            return parsed if isinstance(parsed, list) else [parsed]
+        except ValueError:
+            pass
+    return [tags] if tags else []
+
+_ENV_LOADED = False
 
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-
+        # Single read + partition: cheaper than per-line text iteration and
+        # runs exactly once thanks to the module flag
+        for line in env_path.read_bytes().split(b"\n"):
+            line = line.strip()
+            if line and line[:1] != b"#" and b"=" in line:
+                key, _, value = line.partition(b"=")
+                os.environ.setdefault(key.decode(), value.decode())
+
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get the Braintrust API key from environment"""
     load_env()
@@ -47,32 +100,47 @@ def get_api_key() -> str:
         raise ValueError("BRAINTRUST_API_KEY environment variable not set")
     return api_key
 
+# Shared session so back-to-back API calls reuse the pooled TLS connection.
+# Built lazily so importing requests is skipped for --help paths.
+_SESSION = None
+
+def get_session():
+    """Get the shared session, constructed with auth headers on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from urllib3.util.retry import Retry
+        _SESSION = requests.Session()
+        # Honor server-suggested Retry-After waits on 429 instead of aborting
+        # on the first rate limit; POST/PATCH retry too, since a rate-limited
+        # request was rejected before being processed
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=10,
+            max_retries=Retry(
+                total=5, backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "PUT", "PATCH", "DELETE"]),
+                respect_retry_after_header=True,
+            ),
+        ))
+        _SESSION.headers.update({
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json"
+        })
+    return _SESSION
+
 def make_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
     """Make an authenticated request to the Braintrust API"""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
+    import requests
+    session = get_session()
     url = f"{API_BASE_URL}{endpoint}"
 
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-
+        # Single dispatch point: Session.request handles every verb, so no
+        # per-call method comparison chain
+        response = session.request(method, url, params=params, data=serialize_body(data))
         response.raise_for_status()
-        return response.json() if response.text else {}
+        return parse_json(response.content) if response.content else {}
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}", file=sys.stderr)
         if hasattr(e, 'response') and e.response is not None:
@@ -86,24 +154,21 @@ def list_prompts(project_id: Optional[str] = None, limit: int = 100) -> None:
         params["project_id"] = project_id
 
     result = make_request("GET", "/v1/prompt", params=params)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def get_prompt(prompt_id: str) -> None:
     """Get a specific prompt by ID"""
     result = make_request("GET", f"/v1/prompt/{prompt_id}")
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def create_prompt(name: str, project_id: str, slug: Optional[str] = None, prompt_data: Optional[str] = None, description: Optional[str] = None, tags: Optional[str] = None) -> None:
     """Create a new prompt"""
     # Auto-generate slug from name if not provided
     if not slug:
-        slug = name.lower().replace(' ', '-').replace('_', '-')
-        # Remove special characters except hyphens
-        slug = ''.join(c for c in slug if c.isalnum() or c == '-')
-        # Remove consecutive hyphens
-        while '--' in slug:
-            slug = slug.replace('--', '-')
-        slug = slug.strip('-')
+        slug = name.lower().replace(' ', '-').replace('_', '-').translate(_SLUG_TABLE)
+        if not slug.isascii():
+            slug = _NON_SLUG_RE.sub('', slug)
+        slug = _HYPHEN_RUN_RE.sub('-', slug).strip('-')
 
     data = {
         "name": name,
@@ -113,8 +178,8 @@ def create_prompt(name: str, project_id: str, slug: Optional[str] = None, prompt
 
     if prompt_data:
         try:
-            data["prompt_data"] = json.loads(prompt_data)
-        except json.JSONDecodeError:
+            data["prompt_data"] = parse_json(prompt_data)
+        except ValueError:
             data["prompt_data"] = {"prompt": prompt_data}
 
     if description:
@@ -124,14 +189,30 @@ def create_prompt(name: str, project_id: str, slug: Optional[str] = None, prompt
         data["tags"] = parse_tags(tags)
 
     result = make_request("POST", "/v1/prompt", data=data)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def update_prompt(prompt_id: str, name: Optional[str] = None, prompt_data: Optional[str] = None, description: Optional[str] = None, tags: Optional[str] = None, tools_file: Optional[str] = None) -> None:
-    """Update an existing prompt by creating a new version.
+    """Update an existing prompt.
 
-    Uses POST with the same slug to create a new version. Fetches existing
-    prompt first to preserve fields we're not updating (system message, model, etc.).
+    Metadata-only updates (name/description/tags) go through a single PATCH,
+    skipping the read round-trip. Updates that touch prompt_data or tools
+    still fetch the existing prompt and POST a new version with the same
+    slug, because prompt_data is written wholesale and its nested fields
+    (system message, model, tools) must be preserved.
     """
+    if not prompt_data and not tools_file:
+        patch = {}
+        if name:
+            patch["name"] = name
+        if description:
+            patch["description"] = description
+        if tags is not None:
+            patch["tags"] = parse_tags(tags)
+        if patch:
+            result = make_request("PATCH", f"/v1/prompt/{prompt_id}", data=patch)
+            print_json(result)
+            return
+
     # Fetch existing prompt to use as base
     existing = make_request("GET", f"/v1/prompt/{prompt_id}")
 
@@ -157,8 +238,8 @@ def update_prompt(prompt_id: str, name: Optional[str] = None, prompt_data: Optio
         data["name"] = name
     if prompt_data:
         try:
-            data["prompt_data"] = json.loads(prompt_data)
-        except json.JSONDecodeError:
+            data["prompt_data"] = parse_json(prompt_data)
+        except ValueError:
             data["prompt_data"] = {"prompt": prompt_data}
     if description:
         data["description"] = description
@@ -170,8 +251,7 @@ def update_prompt(prompt_id: str, name: Optional[str] = None, prompt_data: Optio
         if not tools_path.exists():
             print(f"Error: Tools file not found: {tools_file}", file=sys.stderr)
             sys.exit(1)
-        with open(tools_path) as f:
-            tools_data = json.load(f)
+        tools_data = parse_json(tools_path.read_bytes())
         # Update tools in prompt_data.prompt.tools (stored as stringified JSON)
         if "prompt_data" not in data:
             data["prompt_data"] = {}
@@ -181,12 +261,12 @@ def update_prompt(prompt_id: str, name: Optional[str] = None, prompt_data: Optio
 
     # POST with same slug creates a new version
     result = make_request("POST", "/v1/prompt", data=data)
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def delete_prompt(prompt_id: str) -> None:
     """Delete a prompt"""
     result = make_request("DELETE", f"/v1/prompt/{prompt_id}")
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 def main():
     parser = argparse.ArgumentParser(description="Manage Braintrust prompts")
@@ -8,24 +8,59 @@ import os
 import sys
 import json
 import argparse
-import requests
+from collections import deque
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE_URL = "https://api.braintrust.dev"
 
+# Indent only when a human is watching; piped output is smaller compact
+_INDENT_OUTPUT = sys.stdout.isatty()
+
+def dump_json(obj) -> bytes:
+    """Serialize to JSON bytes, indented only on a TTY (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _INDENT_OUTPUT else 0)
+    return json.dumps(obj, indent=2 if _INDENT_OUTPUT else None).encode()
+
+def parse_json(raw: bytes):
+    """Parse JSON from raw response bytes without an intermediate str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def open_stdout():
+    """Binary stdout, re-buffered to 1 MiB when piped so multi-MB dumps don't
+    flush every 8 KiB; a TTY keeps the default buffer for prompt feedback"""
+    if sys.stdout.isatty():
+        return sys.stdout.buffer
+    return open(sys.stdout.fileno(), "wb", buffering=1 << 20, closefd=False)
+
+_ENV_LOADED = False
+
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if key not in os.environ:
-                        os.environ[key] = value
-
+        # Single read + partition: cheaper than per-line text iteration and
+        # runs exactly once thanks to the module flag
+        for line in env_path.read_bytes().split(b"\n"):
+            line = line.strip()
+            if line and line[:1] != b"#" and b"=" in line:
+                key, _, value = line.partition(b"=")
+                os.environ.setdefault(key.decode(), value.decode())
+
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get the Braintrust API key from environment"""
     load_env()
@@ -34,36 +69,74 @@ def get_api_key() -> str:
         raise ValueError("BRAINTRUST_API_KEY environment variable not set")
     return api_key
 
+# Shared client so paginated fetches reuse one pooled TLS connection instead
+# of paying a fresh TCP+TLS handshake per page. Built lazily so importing the
+# HTTP stack is skipped for --help paths.
+_SESSION = None
+
+def get_session():
+    """Get the shared HTTP client, constructed with auth headers on first use.
+
+    Prefers an HTTP/2 httpx client so pipelined page fetches multiplex over a
+    single TLS connection; falls back to a pooled requests Session when httpx
+    (or its h2 extra) is not installed.
+    """
+    global _SESSION
+    if _SESSION is None:
+        headers = {
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json"
+        }
+        try:
+            import httpx
+            _SESSION = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                headers=headers,
+                timeout=30.0,
+            )
+        except ImportError:
+            import requests
+            from urllib3.util.retry import Retry
+            _SESSION = requests.Session()
+            # Honor server-suggested Retry-After waits on 429 instead of
+            # aborting a multi-page pull on the first rate limit
+            _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=10,
+                max_retries=Retry(
+                    total=5, backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(["GET"]),
+                    respect_retry_after_header=True,
+                ),
+            ))
+            _SESSION.headers.update(headers)
+    return _SESSION
+
 def make_request(method: str, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
     """Make an authenticated request to the Braintrust API"""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
+    session = get_session()
     url = f"{API_BASE_URL}{endpoint}"
 
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-
+        # Single dispatch point: both client flavors expose .request, so no
+        # per-call method comparison chain
+        response = session.request(method, url, params=params)
         response.raise_for_status()
-        return response.json() if response.text else {}
-    except requests.exceptions.RequestException as e:
+        return parse_json(response.content) if response.content else {}
+    except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response: {e.response.text}", file=sys.stderr)
+        response = getattr(e, 'response', None)
+        if response is not None:
+            print(f"Response: {response.text}", file=sys.stderr)
         sys.exit(1)
 
-def check_if_expected_edited(audit_data: List[Dict[str, Any]]) -> bool:
+def check_if_expected_edited(audit_data: Optional[List[Dict[str, Any]]]) -> bool:
     """
     Check if the expected field was manually edited by examining audit_data.
 
     Args:
-        audit_data: List of audit entries from the raw event
+        audit_data: List of audit entries from the raw event, if any
 
     Returns:
         True if the expected field was edited after initial creation
@@ -71,89 +144,150 @@ def check_if_expected_edited(audit_data: List[Dict[str, Any]]) -> bool:
     if not audit_data:
         return False
 
+    # Tight scan: one short-circuiting condition per entry, no default-dict or
+    # default-list allocations. A 'merge' action whose path starts at
+    # 'expected' (e.g. ['expected', 'departureAirports']) indicates an edit.
     for entry in audit_data:
-        audit_info = entry.get("audit_data", {})
-        path = audit_info.get("path", [])
-        # Check if 'expected' is in the path (e.g., ['expected', 'departureAirports'])
-        if path and len(path) > 0 and path[0] == "expected":
-            action = audit_info.get("action")
-            # 'merge' action on expected field indicates an edit
-            if action == "merge":
-                return True
+        audit_info = entry.get("audit_data")
+        if audit_info is None:
+            continue
+        path = audit_info.get("path")
+        if path and path[0] == "expected" and audit_info.get("action") == "merge":
+            return True
 
     return False
 
 
-def transform_to_flat_dataset(raw_results: List[Dict[str, Any]], max_records: Optional[int] = None, edited_only: bool = False) -> List[Dict[str, Any]]:
+# Shared default for missing optional dict fields; treated as immutable by
+# convention so hot paths skip a fresh {} allocation per event
+_EMPTY: Dict[str, Any] = {}
+
+# Event fields relayed verbatim into each flat record
+_RECORD_FIELDS = ("input", "output", "expected")
+
+def _compile_record_builder():
+    """Generate the flat-record constructor from _RECORD_FIELDS at import time.
+
+    A generated dict literal compiles to a single BUILD_CONST_KEY_MAP, which
+    is cheaper per record than assembling the dict through repeated dynamic
+    lookups, and adding a relayed field stays a one-tuple change.
+    """
+    fields = ", ".join(f'"{name}": get("{name}")' for name in _RECORD_FIELDS)
+    src = (
+        "def _build_flat_record(get, root_span_id, metadata, scores, origin_info):\n"
+        f'    return {{"root_span_id": root_span_id, {fields},'
+        ' "metadata": metadata, "scores": scores, "origin": origin_info}\n'
+    )
+    namespace = {}
+    exec(src, namespace)
+    return namespace["_build_flat_record"]
+
+_build_flat_record = _compile_record_builder()
+
+
+def transform_to_flat_dataset(raw_results, max_records: Optional[int] = None, edited_only: bool = False) -> List[Dict[str, Any]]:
     """
     Transform raw Braintrust results into a clean flat dataset structure
 
     Args:
-        raw_results: Raw results from Braintrust API
+        raw_results: Iterable of raw results from Braintrust API
         max_records: Maximum number of clean records to return (default: unlimited)
         edited_only: If True, only return records where 'expected' was manually edited
 
     Returns:
         List of flat datapoints with input, output, expected, metadata, scores, and origin
     """
-    # First, build a map of root_span_id to scores
-    scores_map = {}
-    for item in raw_results:
-        if item.get("span_attributes", {}).get("type") == "score":
-            root_span_id = item.get("root_span_id")
-            if root_span_id:
-                if root_span_id not in scores_map:
-                    scores_map[root_span_id] = {}
-                # Merge all scores for this root span
-                item_scores = item.get("scores", {})
-                scores_map[root_span_id].update(item_scores)
-
-    # Now collect root items and attach their scores
-    flat_dataset = []
-    for item in raw_results:
+    return list(iter_flat_dataset(raw_results, max_records, edited_only))
+
+
+def iter_flat_dataset(raw_results, max_records: Optional[int] = None, edited_only: bool = False):
+    """
+    Yield flat datapoints from an iterable of raw experiment events.
+
+    Consumes raw_results incrementally, so pages from the fetch generator are
+    released as they are processed; only the flat records are retained. The
+    records are yielded after the input is exhausted because score events may
+    trail the root item they belong to.
+    """
+    # Single pass: score events and root records share the same per-root
+    # scores dict, so scores attach correctly whether they arrive before or
+    # after their root item without a second full iteration.
+    scores_map: Dict[str, Dict[str, Any]] = {}
+    flat_dataset = deque()
+
+    # Bind hot method lookups once; per-event attribute resolution is the
+    # dominant interpreter cost on large pulls
+    flat_dataset_append = flat_dataset.append
+    scores_setdefault = scores_map.setdefault
+
+    def handle_score(get):
+        root_span_id = get("root_span_id")
+        if root_span_id:
+            # Merge all scores for this root span; skip the update (and its
+            # default-dict allocation) when the event carries none
+            scores = get("scores")
+            if scores:
+                scores_setdefault(root_span_id, {}).update(scores)
+
+    def handle_root_or_skip(get):
         # Only process root eval items (where span_id == root_span_id and is_root == True)
-        if item.get("is_root") and item.get("span_id") == item.get("root_span_id"):
-            root_span_id = item.get("root_span_id")
-
-            # Check if expected was edited
-            was_edited = check_if_expected_edited(item.get("audit_data", []))
-
-            # Skip non-edited records if edited_only is True
-            if edited_only and not was_edited:
-                continue
-
-            # Extract origin info for dataset linkage
-            origin = item.get("origin")
-            origin_info = None
-            if origin and origin.get("object_type") == "dataset":
-                origin_info = {
-                    "dataset_id": origin.get("object_id"),
-                    "dataset_record_id": origin.get("id")
-                }
-
-            flat_record = {
-                "root_span_id": root_span_id,
-                "input": item.get("input"),
-                "output": item.get("output"),
-                "expected": item.get("expected"),
-                "metadata": item.get("metadata", {}),
-                "scores": scores_map.get(root_span_id, {}),
-                "origin": origin_info
+        root_span_id = get("root_span_id")
+        if not (get("is_root") and get("span_id") == root_span_id):
+            return
+
+        # After max_records roots, keep scanning so trailing score events
+        # still land in the records already collected
+        if max_records and len(flat_dataset) >= max_records:
+            return
+
+        # Check if expected was edited; skip non-edited records if edited_only
+        was_edited = check_if_expected_edited(get("audit_data"))
+        if edited_only and not was_edited:
+            return
+
+        # Extract origin info for dataset linkage
+        origin = get("origin")
+        origin_info = None
+        if origin and origin.get("object_type") == "dataset":
+            origin_info = {
+                "dataset_id": origin.get("object_id"),
+                "dataset_record_id": origin.get("id")
             }
 
-            # Add edited flag when filtering for edits
-            if edited_only:
-                flat_record["edited"] = True
+        flat_record = _build_flat_record(
+            get, root_span_id, get("metadata") or _EMPTY,
+            scores_setdefault(root_span_id, {}), origin_info
+        )
 
-            flat_dataset.append(flat_record)
+        # Add edited flag when filtering for edits
+        if edited_only:
+            flat_record["edited"] = True
 
-            # Check if we've reached max_records
-            if max_records and len(flat_dataset) >= max_records:
-                break
+        flat_dataset_append(flat_record)
 
-    return flat_dataset
+    # One classification per event: span type picks the handler, so the main
+    # loop carries no per-category branching of its own
+    handlers = {"score": handle_score}
+    handlers_get = handlers.get
 
-def fetch_experiment_results(experiment_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    for item in raw_results:
+        get = item.get
+        # sa-is-None check instead of a chained .get with a {} default, which
+        # would allocate a throwaway dict for every non-score event
+        sa = get("span_attributes")
+        handlers_get(sa.get("type") if sa is not None else None, handle_root_or_skip)(get)
+
+    # The map's own references go first: scores for roots that never became
+    # records (filtered or non-root) are garbage immediately
+    scores_map.clear()
+
+    # Drain while yielding so each record (and its shared scores dict) is
+    # released as soon as the consumer is done with it, instead of the whole
+    # batch staying resident until the generator closes
+    while flat_dataset:
+        yield flat_dataset.popleft()
+
+def fetch_experiment_results(experiment_id: str, limit: Optional[int] = None):
     """
     Fetch all results from an experiment using pagination
 
@@ -161,30 +295,35 @@ def fetch_experiment_results(experiment_id: str, limit: Optional[int] = None) ->
         experiment_id: The experiment ID to fetch results from
         limit: Number of results per page (default: 1000, max per Braintrust API)
 
-    Returns:
-        List of all raw experiment events
+    Yields:
+        Raw experiment events, page by page, so each page can be released
+        once consumed instead of accumulating the whole pull in memory
     """
-    all_results = []
-    cursor = None
-    page_limit = limit or 1000  # Default to max allowed by API
-
-    while True:
-        params = {"limit": page_limit}
-        if cursor:
-            params["cursor"] = cursor
-
-        response = make_request("GET", f"/v1/experiment/{experiment_id}/fetch", params=params)
+    from concurrent.futures import ThreadPoolExecutor
 
-        # Extract events from response
-        events = response.get("events", [])
-        all_results.extend(events)
-
-        # Check if there are more pages
-        cursor = response.get("cursor")
-        if not cursor:
-            break
-
-    return all_results
+    page_limit = limit or 1000  # Default to max allowed by API
+    endpoint = f"/v1/experiment/{experiment_id}/fetch"
+
+    # Cursors are opaque, so pages can't be fetched fully in parallel; instead
+    # pipeline them: as soon as a page's cursor is known, the next request is
+    # in flight on a worker thread while this thread consumes the events.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(make_request, "GET", endpoint, {"limit": page_limit})
+        while future is not None:
+            page = future.result()
+            cursor = page.get("cursor")
+            events = page.pop("events", [])
+            # Drop the page envelope before yielding so only this page's
+            # events stay alive while downstream consumes them
+            del page
+            if cursor:
+                future = executor.submit(
+                    make_request, "GET", endpoint,
+                    {"limit": page_limit, "cursor": cursor}
+                )
+            else:
+                future = None
+            yield from events
 
 def main():
     parser = argparse.ArgumentParser(
@@ -204,6 +343,9 @@ Examples:
   # Fetch only records where 'expected' was manually edited
   %(prog)s abc-123-def --edited-only
 
+  # Stream records as newline-delimited JSON (constant memory)
+  %(prog)s abc-123-def --ndjson > results.ndjson
+
   # Save to file
   %(prog)s abc-123-def > results.json
         """
@@ -213,13 +355,34 @@ Examples:
     parser.add_argument("--limit", type=int, help="Number of raw events per API page (default: 1000)")
     parser.add_argument("--max-results", type=int, help="Maximum number of clean records to return (default: unlimited)")
     parser.add_argument("--edited-only", action="store_true", help="Only return records where 'expected' was manually edited")
+    parser.add_argument("--ndjson", action="store_true", help="Stream records as newline-delimited JSON instead of a single array")
 
     args = parser.parse_args()
 
     try:
         raw_results = fetch_experiment_results(args.experiment_id, args.limit)
-        flat_dataset = transform_to_flat_dataset(raw_results, args.max_results, args.edited_only)
-        print(json.dumps(flat_dataset, indent=2))
+        out = open_stdout()
+        dump = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode())
+        if args.ndjson:
+            for record in iter_flat_dataset(raw_results, args.max_results, args.edited_only):
+                out.write(dump(record))
+                out.write(b"\n")
+        elif _INDENT_OUTPUT:
+            # A human is watching: keep the pretty-printed array
+            flat_dataset = transform_to_flat_dataset(raw_results, args.max_results, args.edited_only)
+            out.write(dump_json(flat_dataset) + b"\n")
+        else:
+            # Piped array output is assembled record by record, so each
+            # record's bytes are written and released immediately and the
+            # dataset never coexists with one giant serialized blob
+            out.write(b"[")
+            sep = b""
+            for record in iter_flat_dataset(raw_results, args.max_results, args.edited_only):
+                out.write(sep)
+                out.write(dump(record))
+                sep = b","
+            out.write(b"]\n")
+        out.flush()
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -6,26 +6,43 @@ Waits for completion and returns full results (synchronous execution)
 """
 
 import os
+import re
 import sys
 import json
+import uuid
 import argparse
-import requests
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE_URL = "https://api.braintrust.dev"
 
+def parse_json(raw: bytes):
+    """Parse JSON from raw response bytes without an intermediate str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+_ENV_LINE_RE = re.compile(rb"^(\w+)=(.*?)\r?$", re.MULTILINE)
+_ENV_LOADED = False
+
+
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if key not in os.environ:
-                        os.environ[key] = value
+        # One read and one compiled-regex pass instead of a per-line loop
+        for key, value in _ENV_LINE_RE.findall(env_path.read_bytes()):
+            os.environ.setdefault(key.decode(), value.decode())
 
 def get_api_key() -> str:
     """Get the Braintrust API key from environment"""
@@ -35,6 +52,34 @@ def get_api_key() -> str:
         raise ValueError("BRAINTRUST_API_KEY environment variable not set")
     return api_key
 
+# Shared session so repeated launches from one process reuse the pooled TLS
+# connection. Built lazily so importing requests is skipped for --help paths.
+# No retries on the adapter: re-posting /v1/eval would rerun a multi-minute
+# evaluation.
+_SESSION = None
+
+@lru_cache(maxsize=32)
+def scorer_payload_key(scorer_type: str) -> str:
+    """Classify a scorer as a function_id (UUID) or a global autoevals name"""
+    try:
+        uuid.UUID(scorer_type)
+        return "function_id"
+    except ValueError:
+        return "global_function"
+
+def get_session():
+    """Get the shared session, constructed with auth headers on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        _SESSION.headers.update({
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json"
+        })
+    return _SESSION
+
 def launch_eval(
     project_id: str,
     prompt_id: str,
@@ -57,13 +102,6 @@ def launch_eval(
     Returns:
         Dictionary containing experiment results and URLs
     """
-    api_key = get_api_key()
-
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
     # Build the request payload
     payload = {
         "project_id": project_id,
@@ -74,12 +112,9 @@ def launch_eval(
             "function_id": prompt_id
         },
         "scores": [
-            {
-                # If scorer_type looks like a UUID, treat it as a function_id
-                # Otherwise treat it as a global_function name (e.g., "Factuality")
-                "function_id" if len(scorer_type) == 36 and scorer_type.count('-') == 4
-                else "global_function": scorer_type
-            }
+            # UUIDs are function ids; anything else is a global_function name
+            # (e.g., "Factuality")
+            {scorer_payload_key(scorer_type): scorer_type}
         ],
         "experiment_name": experiment_name,
         "stream": False  # Wait for completion
@@ -88,6 +123,7 @@ def launch_eval(
     # If custom field scoring is requested, we'd need a custom scorer function
     # For now, using global autoevals scorers
 
+    import requests
     try:
         print(f"Launching experiment on Braintrust platform...")
         print(f"  Project ID: {project_id}")
@@ -99,16 +135,10 @@ def launch_eval(
         print("Waiting for experiment to complete (this may take 1-5 minutes)...")
         print()
 
-        response = requests.post(
-            f"{API_BASE_URL}/v1/eval",
-            headers=headers,
-            json=payload
-        )
+        response = get_session().post(f"{API_BASE_URL}/v1/eval", json=payload)
 
         response.raise_for_status()
-        result = response.json()
-
-        return result
+        return parse_json(response.content)
 
     except requests.exceptions.RequestException as e:
         print(f"Error launching evaluation: {e}", file=sys.stderr)
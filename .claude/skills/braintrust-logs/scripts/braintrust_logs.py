@@ -8,14 +8,40 @@ import os
 import sys
 import json
 import argparse
+from functools import lru_cache
 import requests
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE_URL = "https://api.braintrust.dev"
 
+def serialize_body(data) -> Optional[bytes]:
+    """Pre-serialize a request body so requests doesn't json.dumps it again"""
+    if data is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def parse_json(raw: bytes):
+    """Parse JSON from raw response bytes without an intermediate str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+_ENV_LOADED = False
+
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
         with open(env_path) as f:
@@ -26,6 +52,7 @@ def load_env():
                     if key not in os.environ:
                         os.environ[key] = value
 
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get the Braintrust API key from environment"""
     load_env()
@@ -34,51 +61,87 @@ def get_api_key() -> str:
         raise ValueError("BRAINTRUST_API_KEY environment variable not set")
     return api_key
 
+# Shared session so sequential API calls reuse the pooled TLS connection
+# instead of handshaking per request; built lazily so auth is resolved once
+# on first use.
+_SESSION = None
+
+def get_session():
+    """Get the shared session, constructed with auth headers on first use"""
+    global _SESSION
+    if _SESSION is None:
+        from urllib3.util.retry import Retry
+        _SESSION = requests.Session()
+        # Inserted events may lack explicit ids, so a replayed POST could
+        # duplicate them: retry only statuses where the request was rejected
+        # or never reached the app, honoring server Retry-After waits on 429
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=20,
+            max_retries=Retry(
+                total=5, backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "PATCH", "DELETE"]),
+                respect_retry_after_header=True,
+            ),
+        ))
+        _SESSION.headers.update({
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json"
+        })
+    return _SESSION
+
+# Full error-response bodies are only decoded when explicitly requested
+_DEBUG = os.environ.get("BRAINTRUST_DEBUG") == "1"
+
 def make_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
     """Make an authenticated request to the Braintrust API"""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
     url = f"{API_BASE_URL}{endpoint}"
 
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-
+        # Single dispatch point: Session.request handles every verb and the
+        # session already carries the auth headers
+        response = get_session().request(method, url, params=params, data=serialize_body(data))
         response.raise_for_status()
-        return response.json() if response.text else {}
+        return parse_json(response.content) if response.content else {}
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}", file=sys.stderr)
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response: {e.response.text}", file=sys.stderr)
+        response = getattr(e, 'response', None)
+        if response is not None:
+            if _DEBUG:
+                print(f"Response: {response.text}", file=sys.stderr)
+            else:
+                # Skip decoding the body unless explicitly debugging
+                print(f"Response: {response.status_code} {response.reason}", file=sys.stderr)
         sys.exit(1)
 
+# Stay well under any server-side cap on events per insert request
+INSERT_BATCH_SIZE = 500
+
 def insert_logs(project_id: str, events_file: str) -> None:
     """Insert log events into a project from a JSON file"""
     try:
-        with open(events_file, 'r') as f:
-            events = json.load(f)
+        with open(events_file, 'rb') as f:
+            events = parse_json(f.read())
 
         if not isinstance(events, list):
             events = [events]
 
-        data = {
-            "project_id": project_id,
-            "events": events
-        }
-
-        result = make_request("POST", "/v1/project-logs-insert", data=data)
+        if len(events) <= INSERT_BATCH_SIZE:
+            result = make_request("POST", "/v1/project-logs-insert",
+                                  data={"project_id": project_id, "events": events})
+        else:
+            # POST in bounded chunks and merge the responses into one dict
+            # with a combined row_ids list
+            result = {}
+            row_ids = []
+            for start in range(0, len(events), INSERT_BATCH_SIZE):
+                chunk = events[start:start + INSERT_BATCH_SIZE]
+                resp = make_request("POST", "/v1/project-logs-insert",
+                                    data={"project_id": project_id, "events": chunk})
+                if not result:
+                    result = resp
+                row_ids.extend(resp.get("row_ids", []))
+            result["row_ids"] = row_ids
         print(json.dumps(result, indent=2))
     except FileNotFoundError:
         print(f"Error: File not found: {events_file}", file=sys.stderr)
@@ -5,10 +5,11 @@ CRUD operations for Braintrust project scores (scorers) via the REST API
 """
 
 import os
+import re
 import sys
 import json
 import argparse
-import requests
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -25,20 +26,29 @@ def parse_tags(tags: Optional[str]) -> Optional[list]:
     except json.JSONDecodeError:
         return [tags] if tags else []
 
+@lru_cache(maxsize=64)
+def _load_config(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON config file, cached by (path, mtime) across calls."""
+    with open(path) as f:
+        return json.load(f)
+
+_ENV_LINE_RE = re.compile(rb"^(\w+)=(.*?)\r?$", re.MULTILINE)
+_ENV_LOADED = False
+
+
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key and key not in os.environ:
-                        os.environ[key] = value
+        # One read and one compiled-regex pass instead of a per-line loop
+        for key, value in _ENV_LINE_RE.findall(env_path.read_bytes()):
+            os.environ.setdefault(key.decode(), value.decode())
 
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get the Braintrust API key from environment"""
     load_env()
@@ -47,27 +57,50 @@ def get_api_key() -> str:
         raise ValueError("BRAINTRUST_API_KEY environment variable not set")
     return api_key
 
+# Shared session so back-to-back API calls reuse the pooled TLS connection.
+# Built lazily so importing requests is skipped for --help paths.
+_SESSION = None
+
+def get_session():
+    """Get the shared session, constructed with auth headers on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from urllib3.util.retry import Retry
+        _SESSION = requests.Session()
+        # Mutating verbs retry only on statuses where the request was
+        # rejected or never reached the app, to avoid duplicating writes
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=10,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "PUT", "PATCH", "DELETE"]),
+            ),
+        ))
+        _SESSION.headers.update({
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json"
+        })
+    return _SESSION
+
 def make_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
     """Make an authenticated request to the Braintrust API"""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
+    import requests
+    session = get_session()
     url = f"{API_BASE_URL}{endpoint}"
 
     try:
         if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
+            response = session.get(url, params=params)
         elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
+            response = session.post(url, json=data)
         elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
+            response = session.put(url, json=data)
         elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data)
+            response = session.patch(url, json=data)
         elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
+            response = session.delete(url)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -81,17 +114,9 @@ def make_request(method: str, endpoint: str, data: Optional[Dict] = None, params
 
 def check_project_access(project_id: str) -> bool:
     """Check if we have access to a project. Returns True if accessible, False otherwise."""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
+    import requests
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/v1/project/{project_id}",
-            headers=headers
-        )
+        response = get_session().get(f"{API_BASE_URL}/v1/project/{project_id}")
         if response.status_code == 403:
             return False
         response.raise_for_status()
@@ -146,17 +171,16 @@ def create_scorer(
     if description:
         data["description"] = description
 
-    # Load configuration from file if provided
+    # Load configuration from file if provided; the mtime in the cache key
+    # means edits to the file are picked up while repeat reads are free
     if config_file:
         config_path = Path(config_file)
         if not config_path.exists():
             print(f"Error: Config file not found: {config_file}", file=sys.stderr)
             sys.exit(1)
 
-        with open(config_path) as f:
-            config_data = json.load(f)
-            # Merge config data into request
-            data.update(config_data)
+        # Merge config data into request
+        data.update(_load_config(str(config_path), config_path.stat().st_mtime))
 
     if scorer_type:
         data["score_type"] = scorer_type
@@ -189,9 +213,7 @@ def update_scorer(
             print(f"Error: Config file not found: {config_file}", file=sys.stderr)
             sys.exit(1)
 
-        with open(config_path) as f:
-            config_data = json.load(f)
-            data.update(config_data)
+        data.update(_load_config(str(config_path), config_path.stat().st_mtime))
 
     if tags is not None:
         data["tags"] = parse_tags(tags)
@@ -7,26 +7,43 @@ the newest version of each entry, and updates older entries in all other dataset
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(raw: bytes):
+    """Parse JSON from raw response bytes without an intermediate str copy."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_ENV_LINE_RE = re.compile(rb"^(\w+)=(.*?)\r?$", re.MULTILINE)
+_ENV_LOADED = False
 
 
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if key not in os.environ:
-                        os.environ[key] = value
+        # One read and one compiled-regex pass instead of a per-line loop
+        for key, value in _ENV_LINE_RE.findall(env_path.read_bytes()):
+            os.environ.setdefault(key.decode(), value.decode())
 
 
 def get_api_key() -> str:
@@ -39,43 +56,156 @@ def get_api_key() -> str:
     return api_key
 
 
-def fetch_dataset_metadata(dataset_id: str, headers: dict) -> dict:
+# Shared HTTP client so the burst of per-dataset calls reuses pooled TLS
+# connections instead of handshaking per request; built lazily so auth is
+# resolved once on first use.
+_SESSION = None
+
+
+def get_session():
+    """Get the shared HTTP client, constructed with auth headers on first use.
+
+    Prefers httpx with HTTP/2 so concurrent fetches and the apply-phase
+    insert burst multiplex over a few TLS connections instead of queueing
+    behind HTTP/1.1 head-of-line blocking. Falls back to a pooled requests
+    Session when httpx is not installed; both expose the .get/.post surface
+    the fetch and insert helpers use.
+    """
+    global _SESSION
+    if _SESSION is None:
+        headers = {
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json",
+        }
+        try:
+            import httpx
+            _SESSION = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                headers=headers,
+                timeout=30.0,
+            )
+        except ImportError:
+            import requests
+            from urllib3.util.retry import Retry
+            _SESSION = requests.Session()
+            # POST retries are safe here: the fetch endpoint is a read and
+            # inserts are idempotent on event id
+            _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=20,
+                max_retries=Retry(
+                    total=3, backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(["GET", "POST"]),
+                ),
+            ))
+            _SESSION.headers.update(headers)
+    return _SESSION
+
+
+def fetch_dataset_metadata(dataset_id: str) -> dict:
     """Fetch dataset metadata (name, etc.)."""
     url = f"https://api.braintrustdata.com/v1/dataset/{dataset_id}"
-    resp = requests.get(url, headers=headers)
+    resp = get_session().get(url)
     if resp.status_code != 200:
         print(f"Error fetching metadata for {dataset_id}: {resp.status_code}", file=sys.stderr)
         return {"id": dataset_id, "name": dataset_id}
-    return resp.json()
+    return parse_json(resp.content)
+
 
+# Page size for cursor-paginated fetches; keeps each response payload bounded
+FETCH_PAGE_SIZE = 1000
 
-def fetch_dataset_entries(dataset_id: str, headers: dict) -> list[dict]:
-    """Fetch all entries from a dataset."""
+
+def iter_dataset_entries(dataset_id: str):
+    """Yield pages of entries using the fetch endpoint's cursor pagination.
+
+    Raises on a failed page rather than stopping early: a partially fetched
+    dataset would otherwise look complete to the diff, which under --apply
+    could write updates chosen against a stale newest-entry view.
+    """
     url = f"https://api.braintrustdata.com/v1/dataset/{dataset_id}/fetch"
-    resp = requests.post(url, headers=headers, json={})
-    if resp.status_code != 200:
-        print(f"Error fetching entries for {dataset_id}: {resp.status_code}", file=sys.stderr)
-        return []
-    return resp.json().get("events", [])
+    session = get_session()
+    cursor = None
+    while True:
+        body: dict = {"limit": FETCH_PAGE_SIZE}
+        if cursor:
+            body["cursor"] = cursor
+        resp = session.post(url, json=body)
+        if resp.status_code != 200:
+            raise RuntimeError(f"Error fetching entries for {dataset_id}: {resp.status_code}")
+        page = parse_json(resp.content)
+        events = page.get("events", [])
+        if events:
+            yield events
+        cursor = page.get("cursor")
+        if not cursor or not events:
+            return
+
+
+def load_dataset(dataset_id: str, input_by_key: dict) -> tuple[int, dict]:
+    """Fetch a dataset page by page, folding each page into the newest-entry map.
+
+    Each page is consumed as soon as it arrives, so peak memory per dataset is
+    one page rather than the full events list. Values in the returned map are
+    (created, entry) tuples so each comparison reads the incumbent's timestamp
+    from the tuple instead of re-calling .get on the entry.
+    """
+    entry_map: dict[bytes, tuple[str, dict]] = {}
+    entry_map_get = entry_map.get
+    entry_count = 0
+    for events in iter_dataset_entries(dataset_id):
+        entry_count += len(events)
+        for entry in events:
+            input_val = entry.get("input")
+            input_key = serialize_input(input_val)
+            # Digest keys are not reversible, so remember the first-seen raw
+            # input per key for update payloads and display
+            input_by_key.setdefault(input_key, input_val)
+            created = entry.get("created", "")
+            prev = entry_map_get(input_key)
+            if prev is None or created > prev[0]:
+                # Hash expected once per surviving entry so the diff phase
+                # compares 16-byte digests instead of deep-comparing
+                # arbitrarily nested JSON per cross-dataset pair
+                entry["_exp_hash"] = hash_expected(entry.get("expected"))
+                entry_map[input_key] = (created, entry)
+    return entry_count, entry_map
 
 
-def update_dataset_entry(dataset_id: str, entry_id: str, input_val: Any, expected: Any, headers: dict) -> bool:
-    """Update an entry in a dataset."""
+# Stay well under any server-side cap on events per insert request
+INSERT_BATCH_SIZE = 1000
+
+
+def insert_dataset_events(dataset_id: str, events: list[dict]) -> bool:
+    """Insert a batch of entry updates into a dataset with a single request."""
     url = f"https://api.braintrustdata.com/v1/dataset/{dataset_id}/insert"
-    payload = {
-        "events": [{
-            "id": entry_id,
-            "input": input_val,
-            "expected": expected
-        }]
-    }
-    resp = requests.post(url, headers=headers, json=payload)
+    resp = get_session().post(url, json={"events": events})
     return resp.status_code == 200
 
 
-def serialize_input(input_val: Any) -> str:
-    """Serialize input to a consistent string key."""
-    return json.dumps(input_val, sort_keys=True)
+def _digest16(val: Any) -> bytes:
+    """16-byte BLAKE2b digest of a value's sorted-JSON form."""
+    if orjson is not None:
+        payload = orjson.dumps(val, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(val, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def serialize_input(input_val: Any) -> bytes:
+    """Hash input to a compact 16-byte equality key.
+
+    Only equality matters for matching entries across datasets, so carrying a
+    fixed-size digest through the maps beats dragging potentially-KB JSON
+    strings around as dict keys.
+    """
+    return _digest16(input_val)
+
+
+def hash_expected(expected: Any) -> bytes:
+    """Hash an entry's expected value for diffing, normalizing None to {}."""
+    return _digest16(expected if expected is not None else {})
 
 
 def truncate_input(input_val: Any, max_len: int = 60) -> str:
@@ -111,79 +241,82 @@ def main():
         print("Error: At least 2 dataset IDs required", file=sys.stderr)
         sys.exit(1)
 
-    api_key = get_api_key()
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-
-    # Fetch all datasets
+    # Fetch all datasets concurrently: the metadata and entry calls are
+    # independent across (and within) datasets, so total latency is roughly
+    # the slowest dataset's round-trip instead of the sum of all of them
     datasets = {}
+    input_by_key: dict[bytes, Any] = {}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        meta_futures = {
+            ds_id: executor.submit(fetch_dataset_metadata, ds_id)
+            for ds_id in args.dataset_ids
+        }
+        # Each worker pages through its dataset and folds entries into the
+        # newest-entry map as pages arrive, overlapping download with
+        # processing across datasets
+        load_futures = {
+            ds_id: executor.submit(load_dataset, ds_id, input_by_key)
+            for ds_id in args.dataset_ids
+        }
+
     for ds_id in args.dataset_ids:
-        meta = fetch_dataset_metadata(ds_id, headers)
-        entries = fetch_dataset_entries(ds_id, headers)
+        meta = meta_futures[ds_id].result()
+        try:
+            entry_count, entry_map = load_futures[ds_id].result()
+        except RuntimeError as e:
+            # Abort rather than diff against an incomplete dataset
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
         datasets[ds_id] = {
             "name": meta.get("name", ds_id),
-            "entries": entries,
-            "entry_map": {}  # input_key -> entry
+            "entry_count": entry_count,
+            "entry_map": entry_map  # input_key -> (created, entry)
         }
-        # Build entry map - keep only the newest entry for each input
-        for entry in entries:
-            input_key = serialize_input(entry.get("input"))
-            existing = datasets[ds_id]["entry_map"].get(input_key)
-            if existing is None or entry.get("created", "") > existing.get("created", ""):
-                datasets[ds_id]["entry_map"][input_key] = entry
 
     if not args.json:
         print(f"Syncing {len(datasets)} datasets...")
         for ds_id, ds in datasets.items():
-            print(f'  {ds["name"]}: {len(ds["entries"])} entries')
+            print(f'  {ds["name"]}: {ds["entry_count"]} entries')
         print()
 
-    # Build global map: input_key -> [(dataset_id, entry), ...]
-    global_map: dict[str, list[tuple[str, dict]]] = {}
+    # Build global map: input_key -> [(dataset_id, entry), ...]. setdefault
+    # hits the map once per entry instead of a membership test plus one or
+    # two lookups, and the bound method skips re-resolving the attribute.
+    global_map: dict[bytes, list[tuple[str, dict]]] = {}
+    global_map_setdefault = global_map.setdefault
     for ds_id, ds in datasets.items():
-        for input_key, entry in ds["entry_map"].items():
-            if input_key not in global_map:
-                global_map[input_key] = []
-            global_map[input_key].append((ds_id, entry))
-
-    # Find inputs present in multiple datasets
-    multi_dataset_inputs = {k: v for k, v in global_map.items() if len(v) > 1}
-
-    # Determine updates needed
+        entry_map = ds["entry_map"]
+        for input_key, (_, entry) in entry_map.items():
+            global_map_setdefault(input_key, []).append((ds_id, entry))
+
+    # Determine updates needed. One walk per shared input: max() picks the
+    # newest entry, then the same list is scanned once comparing the
+    # precomputed expected digests (None and {} hash identically, preserving
+    # the old normalization) instead of two scans with deep equality.
     updates_by_dataset: dict[str, list[dict]] = {ds_id: [] for ds_id in datasets}
+    updates_for = updates_by_dataset.__getitem__
+    inputs_in_multiple = 0
     inputs_with_diffs = 0
 
-    for input_key, entries in multi_dataset_inputs.items():
-        # Find the newest entry
-        newest_ds_id = None
-        newest_entry = None
-        newest_created = ""
-
-        for ds_id, entry in entries:
-            created = entry.get("created", "")
-            if created > newest_created:
-                newest_created = created
-                newest_ds_id = ds_id
-                newest_entry = entry
+    for input_key, entries in global_map.items():
+        if len(entries) < 2:
+            continue
+        inputs_in_multiple += 1
 
-        # Check if any other dataset has different expected values
+        newest_ds_id, newest_entry = max(entries, key=lambda pair: pair[1].get("created", ""))
         newest_expected = newest_entry.get("expected")
+        newest_hash = newest_entry["_exp_hash"]
         has_diff = False
 
         for ds_id, entry in entries:
-            if ds_id == newest_ds_id:
-                continue
-
-            entry_expected = entry.get("expected")
-            # Normalize None to {} for comparison
-            norm_newest = newest_expected if newest_expected is not None else {}
-            norm_entry = entry_expected if entry_expected is not None else {}
-
-            if norm_newest != norm_entry:
+            if ds_id != newest_ds_id and entry["_exp_hash"] != newest_hash:
                 has_diff = True
-                updates_by_dataset[ds_id].append({
+                # Carry only the 16-byte key; the raw input is resolved from
+                # input_by_key by whichever output path actually needs it
+                updates_for(ds_id).append({
                     "entry_id": entry.get("id"),
-                    "input": json.loads(input_key),
-                    "old_expected": entry_expected,
+                    "input_key": input_key,
+                    "old_expected": entry.get("expected"),
                     "new_expected": newest_expected,
                     "source_dataset": newest_ds_id
                 })
@@ -192,23 +325,36 @@ def main():
             inputs_with_diffs += 1
 
     # Output results
+    total_updates = sum(len(u) for u in updates_by_dataset.values())
     if args.json:
+        # Digest keys aren't JSON-serializable; swap in the raw inputs here
         result = {
-            "datasets": {ds_id: {"name": ds["name"], "entry_count": len(ds["entries"])} for ds_id, ds in datasets.items()},
+            "datasets": {ds_id: {"name": ds["name"], "entry_count": ds["entry_count"]} for ds_id, ds in datasets.items()},
             "unique_inputs": len(global_map),
-            "inputs_in_multiple": len(multi_dataset_inputs),
+            "inputs_in_multiple": inputs_in_multiple,
             "inputs_with_diffs": inputs_with_diffs,
-            "updates": updates_by_dataset,
+            "updates": {
+                ds_id: [
+                    {
+                        "entry_id": u["entry_id"],
+                        "input": input_by_key[u["input_key"]],
+                        "old_expected": u["old_expected"],
+                        "new_expected": u["new_expected"],
+                        "source_dataset": u["source_dataset"]
+                    }
+                    for u in updates
+                ]
+                for ds_id, updates in updates_by_dataset.items()
+            },
             "applied": args.apply
         }
         print(json.dumps(result, indent=2))
     else:
         print(f"Unique inputs across all datasets: {len(global_map)}")
-        print(f"Inputs present in multiple datasets: {len(multi_dataset_inputs)}")
+        print(f"Inputs present in multiple datasets: {inputs_in_multiple}")
         print(f"Inputs with differing expected values: {inputs_with_diffs}")
         print()
 
-        total_updates = sum(len(u) for u in updates_by_dataset.values())
         if total_updates == 0:
             print("All datasets are in sync!")
         else:
@@ -218,7 +364,7 @@ def main():
                 if updates:
                     print(f'  → "{ds_name}": {len(updates)} update(s)')
                     for i, upd in enumerate(updates[:5], 1):
-                        inp_display = truncate_input(upd["input"])
+                        inp_display = truncate_input(input_by_key[upd["input_key"]])
                         print(f'    {i}. "{inp_display}"')
                         print(f'       old: {upd["old_expected"]}')
                         print(f'       new: {upd["new_expected"]}')
@@ -233,22 +379,30 @@ def main():
         if not args.json:
             print("Applying updates...")
 
-        success_count = 0
-        fail_count = 0
-
-        for ds_id, updates in updates_by_dataset.items():
-            for upd in updates:
-                ok = update_dataset_entry(
-                    ds_id,
-                    upd["entry_id"],
-                    upd["input"],
-                    upd["new_expected"],
-                    headers
-                )
-                if ok:
-                    success_count += 1
+        # The insert endpoint takes an events array, so each dataset needs
+        # one request for all its updates (chunked defensively for very
+        # large diff sets) instead of one request per entry; the batches
+        # still go out concurrently across datasets
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            batch_futures = []
+            for ds_id, updates in updates_by_dataset.items():
+                events = [
+                    {"id": u["entry_id"], "input": input_by_key[u["input_key"]], "expected": u["new_expected"]}
+                    for u in updates
+                ]
+                for start in range(0, len(events), INSERT_BATCH_SIZE):
+                    batch = events[start:start + INSERT_BATCH_SIZE]
+                    batch_futures.append(
+                        (len(batch), executor.submit(insert_dataset_events, ds_id, batch))
+                    )
+
+            success_count = 0
+            fail_count = 0
+            for batch_size, future in batch_futures:
+                if future.result():
+                    success_count += batch_size
                 else:
-                    fail_count += 1
+                    fail_count += batch_size
 
         if not args.json:
             print(f"Done! {success_count} updated, {fail_count} failed")
@@ -5,30 +5,68 @@ Syncs corrected 'expected' values from a Braintrust experiment back to the sourc
 """
 
 import os
+import re
 import sys
 import json
 import argparse
-import subprocess
-import requests
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 API_BASE_URL = "https://api.braintrust.dev"
 
+# Indent only when a human is watching; piped output is smaller compact
+_INDENT_OUTPUT = sys.stdout.isatty()
+
+def dump_json(obj) -> bytes:
+    """Serialize to JSON bytes, indented only on a TTY (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _INDENT_OUTPUT else 0)
+    return json.dumps(obj, indent=2 if _INDENT_OUTPUT else None).encode()
+
+def serialize_body(data) -> Optional[bytes]:
+    """Pre-serialize a request body so requests doesn't json.dumps it again"""
+    if data is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def parse_json(raw: bytes):
+    """Parse JSON from raw response bytes without an intermediate str copy"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(obj) -> None:
+    """Write JSON straight to stdout's byte buffer, skipping print's re-encode"""
+    sys.stdout.buffer.write(dump_json(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+_ENV_LINE_RE = re.compile(rb"^(\w+)=(.*?)\r?$", re.MULTILINE)
+_ENV_LOADED = False
 
 def load_env():
-    """Load environment variables from .env file if it exists"""
+    """Load environment variables from .env file if it exists (once per process)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     env_path = Path.cwd() / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if key not in os.environ:
-                        os.environ[key] = value
+        # One read and one compiled-regex pass instead of a per-line loop
+        for key, value in _ENV_LINE_RE.findall(env_path.read_bytes()):
+            os.environ.setdefault(key.decode(), value.decode())
 
 
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get the Braintrust API key from environment"""
     load_env()
@@ -38,30 +76,81 @@ def get_api_key() -> str:
     return api_key
 
 
+# Shared HTTP client so sequential API calls reuse the pooled TLS connection
+# instead of handshaking per request; built lazily so auth is resolved once
+# on first use.
+_SESSION = None
+# Raw byte bodies go through content= on httpx and data= on requests.
+# Both clients import lazily inside get_session, so --help and dry argparse
+# errors never pay the requests/urllib3 import cost
+_BODY_KWARG = "data"
+
+def get_session():
+    """Get the shared HTTP client, constructed with auth headers on first use.
+
+    Prefers an HTTP/2 httpx client so the metadata GETs and the insert
+    batches multiplex over one TLS connection; falls back to the pooled
+    requests Session when httpx (or its h2 extra) is not installed.
+    """
+    global _SESSION, _BODY_KWARG
+    if _SESSION is None:
+        headers = {
+            "Authorization": f"Bearer {get_api_key()}",
+            "Content-Type": "application/json"
+        }
+        try:
+            import httpx
+            _SESSION = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+                headers=headers,
+                timeout=30.0,
+            )
+            _BODY_KWARG = "content"
+        except ImportError:
+            import requests
+            from urllib3.util.retry import Retry
+            _SESSION = requests.Session()
+            # Upserts here carry explicit record ids, so replaying a POST is
+            # safe; 500 is retried too since one flaky response would
+            # otherwise abort the run and waste every request before it
+            _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=20,
+                max_retries=Retry(
+                    total=5, backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(["GET", "POST"]),
+                    respect_retry_after_header=True,
+                ),
+            ))
+            _SESSION.headers.update(headers)
+    return _SESSION
+
+# Full error-response bodies are only decoded when explicitly requested
+_DEBUG = os.environ.get("BRAINTRUST_DEBUG") == "1"
+
 def make_request(method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
     """Make an authenticated request to the Braintrust API"""
-    api_key = get_api_key()
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
     url = f"{API_BASE_URL}{endpoint}"
 
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-
+        # Single dispatch point: both client flavors expose .request and the
+        # session already carries the auth headers
+        response = get_session().request(
+            method, url, params=params, **{_BODY_KWARG: serialize_body(data)}
+        )
         response.raise_for_status()
-        return response.json() if response.text else {}
-    except requests.exceptions.RequestException as e:
+        return parse_json(response.content) if response.content else {}
+    except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response: {e.response.text}", file=sys.stderr)
+        response = getattr(e, 'response', None)
+        if response is not None:
+            if _DEBUG:
+                print(f"Response: {response.text}", file=sys.stderr)
+            else:
+                # Skip decoding the body unless explicitly debugging
+                reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")
+                print(f"Response: {response.status_code} {reason}", file=sys.stderr)
         sys.exit(1)
 
 
@@ -69,19 +158,38 @@ def fetch_edited_records(experiment_id: str) -> List[Dict[str, Any]]:
     """
     Fetch edited records from an experiment using the fetch skill.
 
+    The sibling fetch script is imported and called in-process, which skips
+    an interpreter launch and the JSON round-trip through a pipe. If the
+    import fails for any reason, the old subprocess path is used instead.
+
     Args:
         experiment_id: The experiment ID to fetch edited records from
 
     Returns:
         List of edited records with origin info
     """
-    # Find the fetch script relative to this script
+    # Find the fetch skill relative to this script
     script_dir = Path(__file__).parent.parent.parent
-    fetch_script = script_dir / "braintrust-fetch-experiment-results" / "scripts" / "fetch_experiment_results.py"
+    fetch_scripts_dir = script_dir / "braintrust-fetch-experiment-results" / "scripts"
+
+    try:
+        if str(fetch_scripts_dir) not in sys.path:
+            sys.path.insert(0, str(fetch_scripts_dir))
+        from fetch_experiment_results import fetch_experiment_results, transform_to_flat_dataset
+    except ImportError:
+        return _fetch_edited_records_subprocess(
+            experiment_id, fetch_scripts_dir / "fetch_experiment_results.py"
+        )
+
+    return transform_to_flat_dataset(fetch_experiment_results(experiment_id), edited_only=True)
+
 
+def _fetch_edited_records_subprocess(experiment_id: str, fetch_script: Path) -> List[Dict[str, Any]]:
+    """Fallback: run the fetch skill as a subprocess and parse its JSON output."""
     if not fetch_script.exists():
         raise FileNotFoundError(f"Fetch script not found at: {fetch_script}")
 
+    import subprocess
     try:
         result = subprocess.run(
             [sys.executable, str(fetch_script), experiment_id, "--edited-only"],
@@ -108,32 +216,47 @@ def prepare_dataset_events(edited_records: List[Dict[str, Any]]) -> List[Dict[st
     Returns:
         List of events ready for dataset insert (upsert)
     """
-    events = []
-    for record in edited_records:
-        origin = record.get("origin")
-        if not origin or not origin.get("dataset_record_id"):
-            print(f"Warning: Skipping record without dataset origin: {record.get('input', '')[:50]}", file=sys.stderr)
-            continue
-
-        event = {
-            "id": origin["dataset_record_id"],  # Use same ID for upsert
+    # One tight comprehension on the happy path: the walrus filter pulls the
+    # upsert id (same id as the dataset record) and skips originless rows
+    # without a per-record append/branch sequence
+    events = [
+        {
+            "id": record_id,
             "input": record.get("input"),
             "expected": record.get("expected"),
+            **({"metadata": record["metadata"]} if record.get("metadata") else {}),
         }
-
-        # Include metadata if present
-        if record.get("metadata"):
-            event["metadata"] = record["metadata"]
-
-        events.append(event)
+        for record in edited_records
+        if (record_id := (record.get("origin") or {}).get("dataset_record_id"))
+    ]
+
+    # Warn about skipped records only when something was actually skipped
+    if len(events) != len(edited_records):
+        for record in edited_records:
+            origin = record.get("origin")
+            if not origin or not origin.get("dataset_record_id"):
+                print(f"Warning: Skipping record without dataset origin: {record.get('input', '')[:50]}", file=sys.stderr)
+
+    # A row edited several times within the experiment shows up once per
+    # edit; collapse to one upsert per id, keeping the last edit (dict
+    # insertion order makes the rebuild last-wins)
+    if len(events) > 1:
+        deduped = {event["id"]: event for event in events}
+        if len(deduped) != len(events):
+            print(f"Note: Collapsed {len(events) - len(deduped)} duplicate edit(s) of the same dataset record", file=sys.stderr)
+            events = list(deduped.values())
 
     return events
 
 
+@lru_cache(maxsize=128)
 def get_dataset_info(dataset_id: str) -> Dict[str, Any]:
     """
     Fetch dataset info including name and project.
 
+    Metadata is stable within a run, so repeat lookups are served from the
+    in-process cache.
+
     Args:
         dataset_id: The dataset ID
 
@@ -143,10 +266,13 @@ def get_dataset_info(dataset_id: str) -> Dict[str, Any]:
     return make_request("GET", f"/v1/dataset/{dataset_id}")
 
 
+@lru_cache(maxsize=128)
 def get_project_info(project_id: str) -> Dict[str, Any]:
     """
     Fetch project info including name.
 
+    Cached like get_dataset_info; project names don't change mid-run.
+
     Args:
         project_id: The project ID
 
@@ -176,14 +302,26 @@ def build_dataset_url(dataset_info: Dict[str, Any], project_info: Dict[str, Any]
     return f"https://www.braintrust.dev/app/{org_name}/p/{project_name}/datasets/{dataset_name}"
 
 
-def update_dataset(dataset_id: str, events: List[Dict[str, Any]], dry_run: bool = False) -> Dict[str, Any]:
+# Stay well under any server-side cap on events per insert request
+BATCH_SIZE = 500
+
+
+def update_dataset(dataset_id: str, events: List[Dict[str, Any]], dry_run: bool = False,
+                   executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, Any]:
     """
     Update dataset records via the insert API (upsert behavior).
 
+    Large edit sets are split into BATCH_SIZE chunks posted concurrently,
+    keeping each request under size limits; small sets keep the single-POST
+    path. Per-batch responses are merged into one dict with a combined
+    row_ids list.
+
     Args:
         dataset_id: The dataset ID to update
         events: List of events to upsert
         dry_run: If True, don't actually update, just return what would be done
+        executor: Optional pool to run the batch POSTs on; one is created
+            (and torn down) here when not provided
 
     Returns:
         API response or dry-run summary
@@ -196,8 +334,30 @@ def update_dataset(dataset_id: str, events: List[Dict[str, Any]], dry_run: bool
             "events": events
         }
 
-    data = {"events": events}
-    return make_request("POST", f"/v1/dataset/{dataset_id}/insert", data=data)
+    endpoint = f"/v1/dataset/{dataset_id}/insert"
+    if len(events) <= BATCH_SIZE:
+        return make_request("POST", endpoint, data={"events": events})
+
+    chunks = [events[start:start + BATCH_SIZE] for start in range(0, len(events), BATCH_SIZE)]
+    own_pool = executor is None
+    if own_pool:
+        executor = ThreadPoolExecutor(max_workers=10)
+    try:
+        futures = [
+            executor.submit(make_request, "POST", endpoint, {"events": chunk})
+            for chunk in chunks
+        ]
+        responses = [future.result() for future in futures]
+    finally:
+        if own_pool:
+            executor.shutdown()
+
+    combined = responses[0]
+    row_ids: List[Any] = []
+    for resp in responses:
+        row_ids.extend(resp.get("row_ids", []))
+    combined["row_ids"] = row_ids
+    return combined
 
 
 def main():
@@ -234,7 +394,7 @@ Examples:
         if not edited_records:
             print("No edited records found in experiment.", file=sys.stderr)
             sys.stderr.flush()
-            print(json.dumps({"updated": 0, "message": "No edited records found"}))
+            print_json({"updated": 0, "message": "No edited records found"})
             sys.exit(0)
 
         if args.verbose:
@@ -247,48 +407,58 @@ Examples:
             print("Error: Could not determine dataset ID from experiment records", file=sys.stderr)
             sys.exit(1)
 
-        # Step 3: Fetch dataset and project info for URL
-        if args.verbose:
-            print(f"Fetching dataset info...", file=sys.stderr)
-            sys.stderr.flush()
-
-        dataset_info = get_dataset_info(dataset_id)
-        project_id = dataset_info.get("project_id")
-        project_info = get_project_info(project_id) if project_id else {}
-        dataset_url = build_dataset_url(dataset_info, project_info)
+        # Steps 3-5 run as one thread-backed pipeline: the dataset GET runs
+        # while events are prepared, the project GET (only needed for the
+        # output URL) runs while the insert is in flight, and the insert's
+        # own batches fan out on the same pool
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            if args.verbose:
+                print(f"Fetching dataset info...", file=sys.stderr)
+                sys.stderr.flush()
 
-        if args.verbose:
-            print(f"Target dataset: {dataset_info.get('name', dataset_id)}", file=sys.stderr)
-            print(f"Dataset URL: {dataset_url}", file=sys.stderr)
-            sys.stderr.flush()
+            dataset_info_future = executor.submit(get_dataset_info, dataset_id)
 
-        # Step 4: Prepare events for upsert
-        events = prepare_dataset_events(edited_records)
+            # Step 4: Prepare events for upsert
+            events = prepare_dataset_events(edited_records)
 
-        if not events:
-            print("No valid records to update (all records missing dataset origin).", file=sys.stderr)
-            sys.stderr.flush()
-            print(json.dumps({"updated": 0, "message": "No valid records to update"}))
-            sys.exit(0)
+            dataset_info = dataset_info_future.result()
+            project_id = dataset_info.get("project_id")
+            project_info_future = executor.submit(get_project_info, project_id) if project_id else None
 
-        # Step 5: Update dataset (or dry run)
-        if args.dry_run:
             if args.verbose:
-                print("DRY RUN - No changes will be made", file=sys.stderr)
+                print(f"Target dataset: {dataset_info.get('name', dataset_id)}", file=sys.stderr)
+                sys.stderr.flush()
+
+            if not events:
+                print("No valid records to update (all records missing dataset origin).", file=sys.stderr)
                 sys.stderr.flush()
-            result = update_dataset(dataset_id, events, dry_run=True)
+                print_json({"updated": 0, "message": "No valid records to update"})
+                sys.exit(0)
+
+            # Step 5: Update dataset (or dry run)
+            if args.dry_run:
+                if args.verbose:
+                    print("DRY RUN - No changes will be made", file=sys.stderr)
+                    sys.stderr.flush()
+                result = update_dataset(dataset_id, events, dry_run=True)
+            else:
+                if args.verbose:
+                    print(f"Updating {len(events)} records in dataset...", file=sys.stderr)
+                    sys.stderr.flush()
+                result = update_dataset(dataset_id, events, dry_run=False, executor=executor)
+                result["updated"] = len(events)
+                result["dataset_id"] = dataset_id
+                result["dataset_name"] = dataset_info.get("name")
+
+            project_info = project_info_future.result() if project_info_future else {}
+            dataset_url = build_dataset_url(dataset_info, project_info)
             result["dataset_url"] = dataset_url
-        else:
+
             if args.verbose:
-                print(f"Updating {len(events)} records in dataset...", file=sys.stderr)
+                print(f"Dataset URL: {dataset_url}", file=sys.stderr)
                 sys.stderr.flush()
-            result = update_dataset(dataset_id, events, dry_run=False)
-            result["updated"] = len(events)
-            result["dataset_id"] = dataset_id
-            result["dataset_name"] = dataset_info.get("name")
-            result["dataset_url"] = dataset_url
 
-        print(json.dumps(result, indent=2))
+        print_json(result)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
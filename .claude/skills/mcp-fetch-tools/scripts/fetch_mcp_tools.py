@@ -11,9 +11,13 @@ Example:
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -24,25 +28,87 @@ except ImportError:
     sys.exit(1)
 
 
+# Parameter-table row template, bound once; each row is a single format_map
+# call instead of per-field f-string assembly
+_ROW_FMT = "| {name} | {type} | {req} | {default} | {desc} |\n".format_map
+
+
+# Slug translation table, built once: a single C-level pass maps uppercase
+# to lowercase and everything non-alphanumeric to underscores, replacing
+# two regex substitutions plus a trailing .lower() scan. The table only
+# spans Latin-1, so a catch-all regex maps any higher codepoints (IDN
+# hosts, unicode paths) that translate passes through unchanged.
+_SLUG_TABLE = {i: "_" for i in range(256)}
+for _c in "abcdefghijklmnopqrstuvwxyz0123456789":
+    _SLUG_TABLE[ord(_c)] = _c
+for _c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+    _SLUG_TABLE[ord(_c)] = _c.lower()
+_NON_SLUG_RE = re.compile(r"[^a-z0-9_]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
 def url_to_slug(url: str) -> str:
     """Convert URL to snake_case slug for directory naming."""
     parsed = urlparse(url)
     # Combine host and path, remove protocol
     raw = f"{parsed.netloc}{parsed.path}"
-    # Replace non-alphanumeric with underscores, collapse multiple underscores
-    slug = re.sub(r'[^a-zA-Z0-9]+', '_', raw)
-    slug = re.sub(r'_+', '_', slug)
-    # Remove leading/trailing underscores
-    slug = slug.strip('_')
-    return slug.lower()
+    slug = raw.translate(_SLUG_TABLE)
+    if not slug.isascii():
+        slug = _NON_SLUG_RE.sub("_", slug)
+    return _UNDERSCORE_RUN_RE.sub("_", slug).strip("_")
+
+
+# Shared session so the initialize and tools/list POSTs reuse one TCP/TLS
+# connection; built lazily on first request
+_SESSION = None
+
+
+def get_session():
+    """Get the shared requests session, created on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        _SESSION.headers.update({
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream"
+        })
+    return _SESSION
+
+
+CACHE_DIR = Path.home() / ".cache" / "fetch-mcp-tools"
+
+
+def cached_fetch(url: str, name: str, fetch_fn, ttl: int, refresh: bool = False):
+    """Run fetch_fn(url), caching its result on disk for ttl seconds.
+
+    Cache files are keyed by a hash of the URL plus the call name, so a
+    repeat run against an unchanged server skips both network round trips.
+    A ttl of 0 disables the cache entirely; refresh skips the read but
+    still updates the cache with the fresh response.
+    """
+    path = CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}-{name}.json"
+    if ttl > 0 and not refresh:
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            pass  # missing, expired, or corrupt cache entry: refetch
+
+    result = fetch_fn(url)
+    if ttl > 0:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent run never reads a torn file
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(result))
+            os.replace(tmp, path)
+        except OSError:
+            pass  # cache is best-effort; the fresh result still gets returned
+    return result
 
 
 def mcp_request(url: str, method: str, params: dict = None) -> dict:
     """Send a JSON-RPC request to an MCP server."""
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json, text/event-stream"
-    }
     payload = {
         "jsonrpc": "2.0",
         "method": method,
@@ -51,7 +117,7 @@ def mcp_request(url: str, method: str, params: dict = None) -> dict:
     if params:
         payload["params"] = params
 
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    response = get_session().post(url, json=payload, timeout=30)
     response.raise_for_status()
 
     result = response.json()
@@ -77,6 +143,12 @@ def fetch_tools(url: str) -> list:
     return result.get("tools", [])
 
 
+def write_tools_json(path: Path, openai_tools: list) -> None:
+    """Write the OpenAI-format tools.json file."""
+    with open(path, "w") as f:
+        json.dump(openai_tools, f, indent=2)
+
+
 def mcp_tool_to_openai(tool: dict) -> dict:
     """Convert MCP tool format to OpenAI tool format."""
     return {
@@ -89,38 +161,44 @@ def mcp_tool_to_openai(tool: dict) -> dict:
     }
 
 
-def generate_markdown(url: str, server_info: dict, tools: list) -> str:
-    """Generate human-readable markdown documentation."""
-    lines = []
+# Buffer size for the streamed markdown file; writes coalesce into 64 KiB
+# blocks instead of one syscall per line
+MD_BUFFER_SIZE = 64 * 1024
+
+
+def write_markdown(fp, url: str, server_info: dict, tools: list) -> None:
+    """Stream human-readable markdown documentation to a binary file.
+
+    Each line is written to the buffered file as it is produced, so peak
+    memory stays at the buffer size rather than the whole document -- for
+    servers with hundreds of tools the full text runs to multiple MB.
+    """
+    write = fp.write
 
     # Header
     server_name = server_info.get("serverInfo", {}).get("name", "Unknown")
     server_version = server_info.get("serverInfo", {}).get("version", "Unknown")
     protocol = server_info.get("protocolVersion", "Unknown")
 
-    lines.append(f"# MCP Server: {server_name}")
-    lines.append("")
-    lines.append(f"**URL:** {url}")
-    lines.append(f"**Version:** {server_version}")
-    lines.append(f"**Protocol:** {protocol}")
-    lines.append("")
+    write(f"# MCP Server: {server_name}\n\n".encode())
+    write(f"**URL:** {url}\n".encode())
+    write(f"**Version:** {server_version}\n".encode())
+    write(f"**Protocol:** {protocol}\n\n".encode())
 
     # Capabilities
     capabilities = server_info.get("capabilities", {})
     if capabilities:
-        lines.append("## Server Capabilities")
-        lines.append("")
+        write(b"## Server Capabilities\n\n")
         for cap_name, cap_value in capabilities.items():
             if isinstance(cap_value, dict):
                 cap_details = ", ".join(f"{k}: {v}" for k, v in cap_value.items())
-                lines.append(f"- **{cap_name}:** {cap_details}")
+                write(f"- **{cap_name}:** {cap_details}\n".encode())
             else:
-                lines.append(f"- **{cap_name}:** {cap_value}")
-        lines.append("")
+                write(f"- **{cap_name}:** {cap_value}\n".encode())
+        write(b"\n")
 
     # Tools
-    lines.append("## Tools")
-    lines.append("")
+    write(b"## Tools\n\n")
 
     for tool in tools:
         tool_name = tool.get("name", "Unknown")
@@ -128,29 +206,27 @@ def generate_markdown(url: str, server_info: dict, tools: list) -> str:
         input_schema = tool.get("inputSchema", {})
         annotations = tool.get("annotations", {})
 
-        lines.append(f"### {tool_name}")
-        lines.append("")
-        lines.append(f"**Description:** {description}")
-        lines.append("")
+        write(f"### {tool_name}\n\n".encode())
+        write(f"**Description:** {description}\n\n".encode())
 
         # Annotations
         if annotations:
-            lines.append("**Annotations:**")
-            lines.append("")
+            write(b"**Annotations:**\n\n")
             for ann_key, ann_value in annotations.items():
-                lines.append(f"- {ann_key}: `{ann_value}`")
-            lines.append("")
+                write(f"- {ann_key}: `{ann_value}`\n".encode())
+            write(b"\n")
 
         # Parameters table
         properties = input_schema.get("properties", {})
-        required = input_schema.get("required", [])
+        # Set membership keeps the per-row required check O(1)
+        required = set(input_schema.get("required", []))
 
         if properties:
-            lines.append("**Parameters:**")
-            lines.append("")
-            lines.append("| Name | Type | Required | Default | Description |")
-            lines.append("|------|------|----------|---------|-------------|")
+            write(b"**Parameters:**\n\n")
+            write(b"| Name | Type | Required | Default | Description |\n")
+            write(b"|------|------|----------|---------|-------------|\n")
 
+            rows = []
             for prop_name, prop_def in properties.items():
                 prop_type = prop_def.get("type", "any")
                 # Handle array types with items
@@ -164,39 +240,37 @@ def generate_markdown(url: str, server_info: dict, tools: list) -> str:
                 elif "enum" in prop_def:
                     prop_type = "enum"
 
-                is_required = "yes" if prop_name in required else "no"
                 default = prop_def.get("default", "-")
                 if default != "-":
                     default = f"`{default}`"
                 prop_desc = prop_def.get("description", "-")
-                # Escape pipes in description
-                prop_desc = prop_desc.replace("|", "\\|")
-
-                lines.append(f"| {prop_name} | {prop_type} | {is_required} | {default} | {prop_desc} |")
-
-            lines.append("")
+                rows.append(_ROW_FMT({
+                    "name": prop_name,
+                    "type": prop_type,
+                    "req": "yes" if prop_name in required else "no",
+                    "default": default,
+                    # Escape pipes in description
+                    "desc": prop_desc.replace("|", "\\|"),
+                }))
+
+            # One encode + one buffered write per table instead of per row
+            write("".join(rows).encode())
+            write(b"\n")
 
         # Full JSON schema
         openai_tool = mcp_tool_to_openai(tool)
-        lines.append("**Full JSON Schema (OpenAI format):**")
-        lines.append("")
-        lines.append("```json")
-        lines.append(json.dumps(openai_tool, indent=2))
-        lines.append("```")
-        lines.append("")
+        write(b"**Full JSON Schema (OpenAI format):**\n\n")
+        write(b"```json\n")
+        write(json.dumps(openai_tool, indent=2).encode())
+        write(b"\n```\n\n")
 
         # Include raw MCP tool definition for reference
-        lines.append("<details>")
-        lines.append("<summary>Raw MCP Tool Definition</summary>")
-        lines.append("")
-        lines.append("```json")
-        lines.append(json.dumps(tool, indent=2))
-        lines.append("```")
-        lines.append("")
-        lines.append("</details>")
-        lines.append("")
-
-    return "\n".join(lines)
+        write(b"<details>\n")
+        write(b"<summary>Raw MCP Tool Definition</summary>\n\n")
+        write(b"```json\n")
+        write(json.dumps(tool, indent=2).encode())
+        write(b"\n```\n\n")
+        write(b"</details>\n\n")
 
 
 def main():
@@ -209,8 +283,25 @@ def main():
         default="mcp-tools",
         help="Output directory (default: mcp-tools)"
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=3600,
+        help="Seconds to reuse cached server responses (default: 3600)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the response cache entirely"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Refetch from the server but still update the cache"
+    )
 
     args = parser.parse_args()
+    cache_ttl = 0 if args.no_cache else args.cache_ttl
 
     url = args.url
     output_base = Path(args.output_dir)
@@ -218,43 +309,53 @@ def main():
     print(f"Fetching MCP tools from: {url}")
     print()
 
-    # Fetch server info
-    print("Fetching server info...")
-    try:
-        server_info = fetch_server_info(url)
-        server_name = server_info.get("serverInfo", {}).get("name", "Unknown")
-        server_version = server_info.get("serverInfo", {}).get("version", "Unknown")
-        print(f"  Server: {server_name} v{server_version}")
-    except Exception as e:
-        print(f"  Warning: Could not fetch server info: {e}")
-        server_info = {}
-
-    # Fetch tools
-    print("Fetching tools...")
-    tools = fetch_tools(url)
-    print(f"  Found {len(tools)} tool(s)")
-
-    if not tools:
-        print("\nNo tools found on this MCP server.")
-        return
-
-    # Create output directory
-    url_slug = url_to_slug(url)
-    output_dir = output_base / url_slug
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate OpenAI-compatible tools.json
-    openai_tools = [mcp_tool_to_openai(tool) for tool in tools]
-    tools_json_path = output_dir / "tools.json"
-    with open(tools_json_path, "w") as f:
-        json.dump(openai_tools, f, indent=2)
+    # The initialize and tools/list calls are independent, as are the two
+    # output writes, so both stages run on a small pool: the HTTP stage
+    # costs one round trip instead of two, and the tools.json write
+    # overlaps with markdown generation
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        info_future = executor.submit(
+            cached_fetch, url, "initialize", fetch_server_info, cache_ttl, args.refresh)
+        tools_future = executor.submit(
+            cached_fetch, url, "tools", fetch_tools, cache_ttl, args.refresh)
+
+        # Fetch server info
+        print("Fetching server info...")
+        try:
+            server_info = info_future.result()
+            server_name = server_info.get("serverInfo", {}).get("name", "Unknown")
+            server_version = server_info.get("serverInfo", {}).get("version", "Unknown")
+            print(f"  Server: {server_name} v{server_version}")
+        except Exception as e:
+            print(f"  Warning: Could not fetch server info: {e}")
+            server_info = {}
+
+        # Fetch tools
+        print("Fetching tools...")
+        tools = tools_future.result()
+        print(f"  Found {len(tools)} tool(s)")
+
+        if not tools:
+            print("\nNo tools found on this MCP server.")
+            return
+
+        # Create output directory
+        url_slug = url_to_slug(url)
+        output_dir = output_base / url_slug
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Generate OpenAI-compatible tools.json
+        openai_tools = [mcp_tool_to_openai(tool) for tool in tools]
+        tools_json_path = output_dir / "tools.json"
+        json_future = executor.submit(write_tools_json, tools_json_path, openai_tools)
+
+        # Stream markdown documentation while tools.json is being written
+        md_path = output_dir / "tool-config.md"
+        with open(md_path, "wb", buffering=MD_BUFFER_SIZE) as f:
+            write_markdown(f, url, server_info, tools)
+
+        json_future.result()
     print(f"\nGenerated: {tools_json_path}")
-
-    # Generate markdown documentation
-    markdown = generate_markdown(url, server_info, tools)
-    md_path = output_dir / "tool-config.md"
-    with open(md_path, "w") as f:
-        f.write(markdown)
     print(f"Generated: {md_path}")
 
     print(f"\nDone! Output saved to: {output_dir}")
@@ -1,53 +1,118 @@
 #!/usr/bin/env python3
 """
 Confluence CLI wrapper for Claude skills.
-Wraps pchuri/confluence-cli commands for page management.
+Calls the Confluence REST API directly (v2 for pages, v1 for search and
+spaces) over a shared keep-alive session; previously shelled out to
+pchuri/confluence-cli per command, paying a fork-exec plus a fresh
+connection on every call.
 """
 
-import subprocess
+import argparse
+import base64
 import json
+import os
 import sys
-import argparse
 from typing import Optional
 
-
-def run_confluence(args: list[str]) -> str:
-    """Run confluence-cli command and return output."""
-    cmd = ['confluence-cli'] + args
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True
-    )
-
-    if result.returncode != 0:
-        error_msg = result.stderr or result.stdout or "Unknown error"
-        return json.dumps({"error": error_msg.strip()})
-
-    # Try to parse as JSON, otherwise return as-is
-    output = result.stdout.strip()
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so the TLS connection is reused between calls; the mounted
+# adapter keeps a stable urllib3 pool for long-running agent processes.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+_SESSION_AUTHED = False
+
+
+def get_session() -> requests.Session:
+    """Get the shared session, attaching auth headers on first use."""
+    global _SESSION_AUTHED
+    if not _SESSION_AUTHED:
+        email = os.environ.get('CONFLUENCE_EMAIL')
+        token = os.environ.get('CONFLUENCE_API_TOKEN')
+        if not email or not token:
+            raise ValueError("CONFLUENCE_EMAIL and CONFLUENCE_API_TOKEN are required")
+        credentials = base64.b64encode(f"{email}:{token}".encode()).decode()
+        _SESSION.headers.update({
+            "Authorization": f"Basic {credentials}",
+            "Content-Type": "application/json",
+        })
+        _SESSION_AUTHED = True
+    return _SESSION
+
+
+def get_wiki_url() -> str:
+    """Get the wiki root URL for API requests."""
+    cloud_id = os.environ.get('CONFLUENCE_CLOUD_ID')
+    if not cloud_id:
+        raise ValueError("CONFLUENCE_CLOUD_ID is required")
+    return f"https://api.atlassian.com/ex/confluence/{cloud_id}/wiki"
+
+
+def handle_response(response: requests.Response) -> dict:
+    """Handle API response and raise errors if needed."""
+    if response.status_code >= 400:
+        try:
+            message = response.json().get("message", response.text)
+        except Exception:
+            message = response.text
+        raise Exception(f"{response.status_code}: {message}")
+    return response.json() if response.content else {}
+
+
+def search(query: str, space: Optional[str] = None, limit: int = 25,
+           stream: bool = False) -> str:
+    """Search for pages.
+
+    With stream, each page is printed as its own NDJSON line the moment it
+    is extracted, so downstream consumers can process rows one at a time
+    instead of loading the whole result array.
+    """
     try:
-        # Validate it's valid JSON
-        json.loads(output)
-        return output
-    except json.JSONDecodeError:
-        # Return raw output wrapped in JSON
-        return json.dumps({"output": output})
-
-
-def search(query: str, space: Optional[str] = None, limit: int = 25) -> str:
-    """Search for pages."""
-    args = ['search', query]
-    if space:
-        args.extend(['--space', space])
-    args.extend(['--limit', str(limit)])
-    return run_confluence(args)
+        cql = f'(title~"{query}" OR text~"{query}") AND type=page'
+        if space:
+            cql += f' AND space="{space}"'
+        response = get_session().get(
+            f"{get_wiki_url()}/rest/api/content/search",
+            params={"cql": cql, "limit": limit},
+        )
+        data = handle_response(response)
+        rows = ({
+            "id": result.get("id"),
+            "title": result.get("title"),
+            "status": result.get("status"),
+        } for result in data.get("results", []))
+        if stream:
+            out = sys.stdout
+            for row in rows:
+                out.write(json.dumps(row) + "\n")
+            return ""
+        pages = list(rows)
+        return json.dumps({"total": len(pages), "pages": pages})
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
 
 def get_page(page_id: str) -> str:
     """Get page content by ID."""
-    return run_confluence(['get', page_id])
+    try:
+        response = get_session().get(
+            f"{get_wiki_url()}/api/v2/pages/{page_id}?body-format=storage"
+        )
+        page = handle_response(response)
+        return json.dumps({
+            "id": page.get("id"),
+            "title": page.get("title"),
+            "version": page.get("version", {}).get("number"),
+            "body": page.get("body", {}).get("storage", {}).get("value"),
+        })
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
 
 def create_page(
@@ -57,10 +122,29 @@ def create_page(
     parent_id: Optional[str] = None
 ) -> str:
     """Create a new page."""
-    args = ['create', '--space', space, '--title', title, '--content', content]
-    if parent_id:
-        args.extend(['--parent', parent_id])
-    return run_confluence(args)
+    try:
+        session = get_session()
+        wiki_url = get_wiki_url()
+
+        space_response = session.get(f"{wiki_url}/api/v2/spaces?keys={space}")
+        space_data = handle_response(space_response)
+        if not space_data.get("results"):
+            raise Exception(f"Space '{space}' not found")
+        space_id = space_data["results"][0]["id"]
+
+        body = {
+            "spaceId": space_id,
+            "status": "current",
+            "title": title,
+            "body": {"representation": "storage", "value": content},
+        }
+        if parent_id:
+            body["parentId"] = parent_id
+
+        result = handle_response(session.post(f"{wiki_url}/api/v2/pages", json=body))
+        return json.dumps({"success": True, "id": result.get("id"), "title": result.get("title")})
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
 
 def update_page(
@@ -69,26 +153,60 @@ def update_page(
     content: Optional[str] = None
 ) -> str:
     """Update an existing page."""
-    args = ['update', page_id]
-    if title:
-        args.extend(['--title', title])
-    if content:
-        args.extend(['--content', content])
-
-    if len(args) == 2:
+    if not title and not content:
         return json.dumps({"error": "No update fields provided"})
 
-    return run_confluence(args)
+    try:
+        session = get_session()
+        wiki_url = get_wiki_url()
+
+        current = handle_response(session.get(
+            f"{wiki_url}/api/v2/pages/{page_id}?body-format=storage"
+        ))
+        body = {
+            "id": page_id,
+            "status": "current",
+            "title": title or current.get("title"),
+            "body": {
+                "representation": "storage",
+                "value": content or current.get("body", {}).get("storage", {}).get("value", ""),
+            },
+            "version": {"number": current.get("version", {}).get("number", 1) + 1},
+        }
+        result = handle_response(session.put(f"{wiki_url}/api/v2/pages/{page_id}", json=body))
+        return json.dumps({
+            "success": True,
+            "id": result.get("id"),
+            "version": result.get("version", {}).get("number"),
+        })
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
 
 def delete_page(page_id: str) -> str:
     """Delete a page."""
-    return run_confluence(['delete', page_id])
+    try:
+        response = get_session().delete(f"{get_wiki_url()}/api/v2/pages/{page_id}")
+        handle_response(response)
+        return json.dumps({"success": True, "id": page_id, "deleted": True})
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
 
 def list_spaces() -> str:
     """List all available spaces."""
-    return run_confluence(['spaces'])
+    try:
+        response = get_session().get(f"{get_wiki_url()}/rest/api/space?limit=250")
+        data = handle_response(response)
+        spaces = [{
+            "id": space.get("id"),
+            "key": space.get("key"),
+            "name": space.get("name"),
+            "type": space.get("type"),
+        } for space in data.get("results", [])]
+        return json.dumps({"spaces": spaces})
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
 
 def main():
@@ -100,6 +218,8 @@ def main():
     search_parser.add_argument("query", help="Search query")
     search_parser.add_argument("--space", "-s", help="Filter by space key")
     search_parser.add_argument("--limit", "-l", type=int, default=25, help="Max results")
+    search_parser.add_argument("--stream", action="store_true",
+                               help="Print one page per line (NDJSON) instead of a wrapped array")
 
     # Get
     get_parser = subparsers.add_parser("get", help="Get page content")
@@ -133,7 +253,9 @@ def main():
 
     try:
         if args.command == "search":
-            print(search(args.query, args.space, args.limit))
+            out = search(args.query, args.space, args.limit, args.stream)
+            if out:
+                print(out)
         elif args.command == "get":
             print(get_page(args.page_id))
         elif args.command == "create":
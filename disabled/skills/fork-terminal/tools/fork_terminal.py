@@ -23,8 +23,11 @@ def fork_terminal(command: str) -> str:
             do script "{command.replace('"', '\\"')}"
         end tell
         '''
+        # Feed the script over stdin: one osascript process, no -e argument
+        # re-parse, and no length limit on the command
         result = subprocess.run(
-            ["osascript", "-e", script],
+            ["osascript", "-"],
+            input=script,
             capture_output=True,
             text=True
         )
@@ -41,14 +44,16 @@ def fork_terminal(command: str) -> str:
             )
             return "Windows Terminal tab opened successfully"
         except (FileNotFoundError, subprocess.CalledProcessError):
-            # Fallback to cmd.exe if Windows Terminal is not available
-            result = subprocess.run(
-                ["start", "cmd", "/k", command],
-                shell=True,
-                capture_output=True,
-                text=True
+            # Fallback to cmd.exe if Windows Terminal is not available.
+            # shell=True spawned an extra cmd.exe just to run start; calling
+            # cmd.exe directly with CREATE_NEW_CONSOLE skips that outer
+            # shell, and not waiting on the window keeps the fork instant
+            subprocess.Popen(
+                ["cmd.exe", "/c", "start", "", "cmd.exe", "/k", command],
+                creationflags=subprocess.CREATE_NEW_CONSOLE,
+                close_fds=True
             )
-            return "Command Prompt window opened successfully" if result.returncode == 0 else result.stderr
+            return "Command Prompt window opened successfully"
 
     else:
         return f"Unsupported platform: {system}. Only macOS and Windows are supported."